@@ -277,9 +277,12 @@ def generate_code_pattern(path: List[Dict]) -> str:
 
 
 def build_navigation_graph(liblcm_path: Path) -> Dict[str, Any]:
-    """Build complete navigation graph."""
+    """Build complete navigation graph from a LibLCM index file."""
+    return navigation_graph_from_liblcm(load_json(liblcm_path))
 
-    liblcm = load_json(liblcm_path)
+
+def navigation_graph_from_liblcm(liblcm: Dict) -> Dict[str, Any]:
+    """Build complete navigation graph."""
 
     # Extract relationships
     rel_data = extract_relationships(liblcm)
@@ -308,9 +311,15 @@ def build_navigation_graph(liblcm_path: Path) -> Dict[str, Any]:
 
 
 def update_liblcm_with_relationships(liblcm_path: Path, nav_graph: Dict):
-    """Update LibLCM entities with structured relationships field."""
+    """Update LibLCM entities in an index file with structured relationships field."""
 
     liblcm = load_json(liblcm_path)
+    add_relationships(liblcm, nav_graph)
+    save_json(liblcm, liblcm_path)
+
+
+def add_relationships(liblcm: Dict, nav_graph: Dict):
+    """Update LibLCM entities with structured relationships field (in place)."""
 
     print("[INFO] Adding relationships to LibLCM entities...")
 
@@ -330,7 +339,6 @@ def update_liblcm_with_relationships(liblcm_path: Path, nav_graph: Dict):
     print(f"[INFO] Updated relationships for {updated} entities")
 
     liblcm["_relationships_added"] = datetime.now(timezone.utc).isoformat()
-    save_json(liblcm, liblcm_path)
 
 
 def print_summary(result: Dict):
@@ -351,7 +359,8 @@ def print_summary(result: Dict):
         print(f"  {path_key}: {steps}")
 
 
-def main():
+def main(argv=None):
+    """Command-line entry point; argv defaults to sys.argv[1:]."""
     parser = argparse.ArgumentParser(
         description="Build navigation graph from LibLCM relationships"
     )
@@ -366,7 +375,7 @@ def main():
         help="Also update LibLCM index with relationships field"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     root = get_project_root()
     liblcm_path = root / "index" / "liblcm" / "flex-api-enhanced.json"
@@ -95,6 +95,23 @@ def build_reverse_mapping(
     flexlibs2_path: Path,
     flexlibs_path: Path = None,
     liblcm_path: Path = None
+) -> Dict[str, Any]:
+    """Build reverse mapping from LibLCM -> FlexLibs index files.
+
+    The FlexLibs stable and LibLCM indexes are optional. See
+    reverse_mapping_from_indexes for the result.
+    """
+    flexlibs2 = load_json(flexlibs2_path)
+    flexlibs = load_json(flexlibs_path) if flexlibs_path and flexlibs_path.exists() else None
+    liblcm = load_json(liblcm_path) if liblcm_path and liblcm_path.exists() else None
+
+    return reverse_mapping_from_indexes(flexlibs2, flexlibs, liblcm)
+
+
+def reverse_mapping_from_indexes(
+    flexlibs2: Dict,
+    flexlibs: Dict = None,
+    liblcm: Dict = None
 ) -> Dict[str, Any]:
     """Build reverse mapping from LibLCM -> FlexLibs.
 
@@ -119,10 +136,6 @@ def build_reverse_mapping(
     }
     """
 
-    flexlibs2 = load_json(flexlibs2_path)
-    flexlibs = load_json(flexlibs_path) if flexlibs_path and flexlibs_path.exists() else None
-    liblcm = load_json(liblcm_path) if liblcm_path and liblcm_path.exists() else None
-
     # Initialize result structure
     result = {
         "_schema": "reverse-mapping/1.0",
@@ -264,9 +277,20 @@ def add_python_wrappers_to_liblcm(
     reverse_mapping: Dict,
     output_path: Path = None
 ):
-    """Add python_wrappers field to LibLCM entities."""
+    """Add python_wrappers field to LibLCM entities in an index file."""
 
     liblcm = load_json(liblcm_path)
+    add_python_wrappers(liblcm, reverse_mapping)
+
+    # Save
+    output = output_path or liblcm_path
+    save_json(liblcm, output)
+
+    return liblcm
+
+
+def add_python_wrappers(liblcm: Dict, reverse_mapping: Dict):
+    """Add python_wrappers field to LibLCM entities (in place)."""
 
     print("[INFO] Adding python_wrappers to LibLCM entities...")
 
@@ -282,12 +306,6 @@ def add_python_wrappers_to_liblcm(
     # Update metadata
     liblcm["_python_wrappers_added"] = datetime.now(timezone.utc).isoformat()
 
-    # Save
-    output = output_path or liblcm_path
-    save_json(liblcm, output)
-
-    return liblcm
-
 
 def print_summary(result: Dict):
     """Print summary statistics."""
@@ -311,7 +329,8 @@ def print_summary(result: Dict):
         print(f"  {prop}: {len(wrappers)} wrappers")
 
 
-def main():
+def main(argv=None):
+    """Command-line entry point; argv defaults to sys.argv[1:]."""
     parser = argparse.ArgumentParser(
         description="Build reverse mapping from LibLCM to FlexLibs"
     )
@@ -326,7 +345,7 @@ def main():
         help="Also update LibLCM index with python_wrappers field"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     root = get_project_root()
 
@@ -121,9 +121,12 @@ def extract_object_type(class_name: str, example: str) -> str:
 
 
 def extract_patterns(flexlibs2_path: Path) -> Dict[str, Any]:
-    """Extract patterns from FlexLibs2 docstrings."""
+    """Extract patterns from the docstrings in a FlexLibs2 index file."""
+    return patterns_from_flexlibs(load_json(flexlibs2_path))
 
-    flexlibs2 = load_json(flexlibs2_path)
+
+def patterns_from_flexlibs(flexlibs2: Dict) -> Dict[str, Any]:
+    """Extract patterns from FlexLibs2 docstrings."""
 
     patterns_by_object = defaultdict(list)
     patterns_by_operation = defaultdict(list)
@@ -192,9 +195,15 @@ def extract_patterns(flexlibs2_path: Path) -> Dict[str, Any]:
 
 
 def add_patterns_to_flexlibs(flexlibs2_path: Path, patterns: Dict):
-    """Add common_patterns field to FlexLibs entities."""
+    """Add common_patterns field to FlexLibs entities in an index file."""
 
     flexlibs2 = load_json(flexlibs2_path)
+    add_patterns(flexlibs2, patterns)
+    save_json(flexlibs2, flexlibs2_path)
+
+
+def add_patterns(flexlibs2: Dict, patterns: Dict):
+    """Add common_patterns field to FlexLibs entities (in place)."""
 
     print("[INFO] Adding common_patterns to FlexLibs2 entities...")
 
@@ -234,7 +243,6 @@ def add_patterns_to_flexlibs(flexlibs2_path: Path, patterns: Dict):
     print(f"[INFO] Added patterns to {updated} entities")
 
     flexlibs2["_patterns_added"] = datetime.now(timezone.utc).isoformat()
-    save_json(flexlibs2, flexlibs2_path)
 
 
 def print_summary(result: Dict):
@@ -254,7 +262,8 @@ def print_summary(result: Dict):
         print(f"  {obj}: {len(patterns)} patterns")
 
 
-def main():
+def main(argv=None):
+    """Command-line entry point; argv defaults to sys.argv[1:]."""
     parser = argparse.ArgumentParser(
         description="Extract common patterns from FlexLibs docstrings"
     )
@@ -269,7 +278,7 @@ def main():
         help="Also update FlexLibs2 index with common_patterns field"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     root = get_project_root()
     flexlibs2_path = root / "index" / "flexlibs" / "flexlibs2_api.json"
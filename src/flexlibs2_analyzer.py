@@ -11,32 +11,76 @@ existing FLExTools-Generator extractions.
 """
 
 import ast
+import hashlib
 import json
+import multiprocessing
 import os
 import sys
 import re
+import shutil
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Any, Iterator, Mapping, Optional, Tuple
+
+# Optional fast JSON encoder for writing the (large) output files
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 def extract_docstring(node) -> str:
-    """Extract docstring from a node if it exists."""
-    if (hasattr(node, 'body') and node.body and
-        isinstance(node.body[0], ast.Expr) and
-        isinstance(node.body[0].value, ast.Constant) and
-        isinstance(node.body[0].value.value, str)):
-        return node.body[0].value.value.strip()
-    elif (hasattr(node, 'body') and node.body and
-          isinstance(node.body[0], ast.Expr) and
-          isinstance(node.body[0].value, ast.Str)):
-        return node.body[0].value.s.strip()
-    return ""
+    """Extract docstring from a module, class or function node if it exists."""
+    return (ast.get_docstring(node, clean=False) or "").strip()
+
+
+# Docstring section headers and the parser state each one switches to
+_SECTION_RE = re.compile(r'^(Args|Returns|Yields|Raises|Example|Notes|Note):')
+_SECTION_STATES = {
+    "Args": "args",
+    "Returns": "returns",
+    "Yields": "returns",
+    "Raises": "raises",
+    "Example": "example",
+    "Note": "notes",
+    "Notes": "notes",
+}
+
+# Argument line: "arg_name (type): description" or "arg_name: description"
+_ARG_RE = re.compile(r'^(\w+)(?:\s*\(([^)]+)\))?:\s*(.*)$')
+
+# Return type at the start of a Returns line: "TypeName: description"
+_RETURN_TYPE_RE = re.compile(r'^([A-Za-z_][\w\[\], ]*?):\s+')
 
 
 def parse_docstring(docstring: str) -> Dict[str, Any]:
-    """Parse a docstring to extract Args, Returns, Raises, Example sections."""
-    result = {
+    """Parse a docstring to extract Args, Returns, Raises, Example sections.
+
+    Results are memoized on the docstring text, since FlexLibs classes share
+    a lot of boilerplate docstrings. Each call returns fresh containers so
+    callers may keep or modify them.
+    """
+    if not docstring:
+        return _empty_parsed_docstring()
+
+    parsed = _parse_docstring_cached(docstring)
+    return {
+        **parsed,
+        "args": {name: dict(info) for name, info in parsed["args"].items()},
+        "raises": list(parsed["raises"]),
+    }
+
+
+def _empty_parsed_docstring() -> Dict[str, Any]:
+    """Get the parse_docstring result for a missing docstring."""
+    return {
         "summary": "",
         "description": "",
         "args": {},
@@ -46,42 +90,35 @@ def parse_docstring(docstring: str) -> Dict[str, Any]:
         "example": ""
     }
 
-    if not docstring:
-        return result
 
-    lines = docstring.split('\n')
+@lru_cache(maxsize=4096)
+def _parse_docstring_cached(docstring: str) -> Dict[str, Any]:
+    """Parse a docstring (cached; the returned dict must not be modified)."""
+    result = _empty_parsed_docstring()
+
+    # Accumulate multi-line sections as lists and join once at the end;
+    # leading blank lines are dropped until a section has content.
+    desc_lines = []
+    return_lines = []
+    example_lines = []
     current_section = "description"
     current_arg = None
 
-    for line in lines:
+    for line in docstring.split('\n'):
         stripped = line.strip()
 
         # Check for section headers
-        if stripped.startswith("Args:"):
-            current_section = "args"
-            continue
-        elif stripped.startswith("Returns:") or stripped.startswith("Yields:"):
-            current_section = "returns"
-            continue
-        elif stripped.startswith("Raises:"):
-            current_section = "raises"
-            continue
-        elif stripped.startswith("Example:"):
-            current_section = "example"
-            continue
-        elif stripped.startswith("Note:") or stripped.startswith("Notes:"):
-            current_section = "notes"
+        section_match = _SECTION_RE.match(stripped)
+        if section_match:
+            current_section = _SECTION_STATES[section_match.group(1)]
             continue
 
         # Process content based on section
         if current_section == "description":
-            if result["description"]:
-                result["description"] += "\n" + stripped
-            else:
-                result["description"] = stripped
+            if desc_lines or stripped:
+                desc_lines.append(stripped)
         elif current_section == "args":
-            # Parse argument: "arg_name (type): description" or "arg_name: description"
-            arg_match = re.match(r'^(\w+)(?:\s*\(([^)]+)\))?:\s*(.*)$', stripped)
+            arg_match = _ARG_RE.match(stripped)
             if arg_match:
                 arg_name = arg_match.group(1)
                 arg_type = arg_match.group(2) or ""
@@ -92,23 +129,25 @@ def parse_docstring(docstring: str) -> Dict[str, Any]:
                 # Continuation of previous arg description
                 result["args"][current_arg]["description"] += " " + stripped
         elif current_section == "returns":
-            if result["returns"]:
-                result["returns"] += " " + stripped
-            else:
-                result["returns"] = stripped
+            if return_lines:
+                return_lines.append(stripped)
+            elif stripped:
+                return_lines.append(stripped)
                 # Extract return type from "TypeName: description" pattern
                 # Handles: "ILexEntry: description", "bool: description", "List[str]: desc"
-                type_match = re.match(r'^([A-Za-z_][\w\[\], ]*?):\s+', stripped)
+                type_match = _RETURN_TYPE_RE.match(stripped)
                 if type_match:
                     result["return_type"] = type_match.group(1).strip()
         elif current_section == "raises":
             if stripped:
                 result["raises"].append(stripped)
         elif current_section == "example":
-            if result["example"]:
-                result["example"] += "\n" + line  # Preserve indentation
-            else:
-                result["example"] = line
+            if example_lines or line:
+                example_lines.append(line)  # Preserve indentation
+
+    result["description"] = "\n".join(desc_lines)
+    result["returns"] = " ".join(return_lines)
+    result["example"] = "\n".join(example_lines)
 
     # Extract summary (first line of description)
     if result["description"]:
@@ -118,30 +157,44 @@ def parse_docstring(docstring: str) -> Dict[str, Any]:
     return result
 
 
+# Method name prefixes and the usage_hint they imply. No prefix is a prefix
+# of another, so a name matches at most one entry.
+METHOD_PREFIX_USAGE_HINTS = {
+    "Get": "retrieval",
+    "Find": "retrieval",
+    "Set": "modification",
+    "Update": "modification",
+    "Create": "creation",
+    "Add": "creation",
+    "New": "creation",
+    "Delete": "deletion",
+    "Remove": "deletion",
+    "Is": "validation",
+    "Has": "validation",
+    "Can": "validation",
+    "Convert": "conversion",
+    "Parse": "conversion",
+    "Format": "conversion",
+    "Move": "manipulation",
+    "Copy": "manipulation",
+    "Load": "retrieval",
+    "Read": "retrieval",
+    "Save": "persistence",
+    "Write": "persistence",
+}
+_METHOD_PREFIX_LENGTHS = sorted({len(prefix) for prefix in METHOD_PREFIX_USAGE_HINTS})
+
+
 def generate_method_usage_hint(method_name: str, return_type: str = "") -> str:
     """Generate usage_hint for a method based on name pattern and return type."""
-    name_lower = method_name.lower()
-
     # Check name prefixes for common patterns
-    if method_name.startswith("Get") or method_name.startswith("Find"):
-        return "retrieval"
-    elif method_name.startswith("Set") or method_name.startswith("Update"):
-        return "modification"
-    elif method_name.startswith("Create") or method_name.startswith("Add") or method_name.startswith("New"):
-        return "creation"
-    elif method_name.startswith("Delete") or method_name.startswith("Remove"):
-        return "deletion"
-    elif method_name.startswith("Is") or method_name.startswith("Has") or method_name.startswith("Can"):
-        return "validation"
-    elif method_name.startswith("Convert") or method_name.startswith("Parse") or method_name.startswith("Format"):
-        return "conversion"
-    elif method_name.startswith("Move") or method_name.startswith("Copy"):
-        return "manipulation"
-    elif method_name.startswith("Load") or method_name.startswith("Read"):
-        return "retrieval"
-    elif method_name.startswith("Save") or method_name.startswith("Write"):
-        return "persistence"
-    elif "list" in name_lower or "all" in name_lower:
+    for length in _METHOD_PREFIX_LENGTHS:
+        hint = METHOD_PREFIX_USAGE_HINTS.get(method_name[:length])
+        if hint:
+            return hint
+
+    name_lower = method_name.lower()
+    if "list" in name_lower or "all" in name_lower:
         return "enumeration"
 
     # Fallback based on return type
@@ -171,6 +224,49 @@ def generate_entity_usage_hint(name: str, category: str, entity_type: str = "cla
         return f"Class for working with {category} data in FieldWorks"
 
 
+# Name fragments and descriptions for methods without docstrings, checked
+# in order; the first fragment found anywhere in the name wins
+METHOD_DESCRIPTION_PATTERNS = (
+    # Get patterns
+    ("GetAll", "Returns all objects of this type"),
+    ("GetCount", "Returns the count of objects"),
+    ("GetGuid", "Returns the unique identifier (GUID) of the object"),
+    ("GetOwner", "Returns the owning object"),
+    ("GetOwning", "Returns the owning object"),
+    ("GetParent", "Returns the parent object"),
+    ("GetForm", "Returns the form (text representation) of the object"),
+    ("GetName", "Returns the name of the object"),
+    ("GetDate", "Returns the date"),
+    ("GetDateModified", "Returns when the object was last modified"),
+    ("GetDateCreated", "Returns when the object was created"),
+
+    # Set patterns
+    ("SetForm", "Sets the form (text representation) of the object"),
+    ("SetName", "Sets the name of the object"),
+
+    # List/collection patterns
+    ("NumberOf", "Returns the count of"),
+    ("AllEntries", "Returns all entries"),
+    ("AllSenses", "Returns all senses"),
+
+    # Action patterns
+    ("Create", "Creates a new object"),
+    ("Delete", "Deletes the object"),
+    ("Add", "Adds an item"),
+    ("Remove", "Removes an item"),
+    ("Find", "Finds objects matching the criteria"),
+    ("Lookup", "Looks up an object by identifier"),
+    ("Move", "Moves the object"),
+    ("Merge", "Merges objects together"),
+    ("Duplicate", "Creates a copy of the object"),
+)
+
+
+# Puts a space before each (ASCII) capital letter, for splitting CamelCase
+# names into words with str.translate
+_CAMEL_SPLIT_TABLE = str.maketrans({c: " " + c for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"})
+
+
 def generate_method_description(method_name: str, params: List[str], return_type: str = "") -> str:
     """Generate a description for methods without docstrings based on naming patterns.
 
@@ -178,67 +274,31 @@ def generate_method_description(method_name: str, params: List[str], return_type
     """
     name = method_name
 
-    # Common pattern mappings
-    patterns = {
-        # Get patterns
-        "GetAll": "Returns all objects of this type",
-        "GetCount": "Returns the count of objects",
-        "GetGuid": "Returns the unique identifier (GUID) of the object",
-        "GetOwner": "Returns the owning object",
-        "GetOwning": "Returns the owning object",
-        "GetParent": "Returns the parent object",
-        "GetForm": "Returns the form (text representation) of the object",
-        "GetName": "Returns the name of the object",
-        "GetDate": "Returns the date",
-        "GetDateModified": "Returns when the object was last modified",
-        "GetDateCreated": "Returns when the object was created",
-
-        # Set patterns
-        "SetForm": "Sets the form (text representation) of the object",
-        "SetName": "Sets the name of the object",
-
-        # List/collection patterns
-        "NumberOf": "Returns the count of",
-        "AllEntries": "Returns all entries",
-        "AllSenses": "Returns all senses",
-
-        # Action patterns
-        "Create": "Creates a new object",
-        "Delete": "Deletes the object",
-        "Add": "Adds an item",
-        "Remove": "Removes an item",
-        "Find": "Finds objects matching the criteria",
-        "Lookup": "Looks up an object by identifier",
-        "Move": "Moves the object",
-        "Merge": "Merges objects together",
-        "Duplicate": "Creates a copy of the object",
-    }
-
-    # Try exact prefix matches first
-    for pattern, desc in patterns.items():
-        if name.startswith(pattern) or pattern in name:
+    # Try known name fragments first
+    for pattern, desc in METHOD_DESCRIPTION_PATTERNS:
+        if pattern in name:
             # Try to make it more specific
             suffix = name.replace(pattern, "").strip()
             if suffix:
                 # CamelCase to words
-                words = re.sub('([A-Z])', r' \1', suffix).strip().lower()
+                words = suffix.translate(_CAMEL_SPLIT_TABLE).strip().lower()
                 return f"{desc} {words}".rstrip()
             return desc
 
     # Fall back to generic patterns based on prefix
     if name.startswith("Get"):
         target = name[3:]  # Remove "Get"
-        words = re.sub('([A-Z])', r' \1', target).strip().lower()
+        words = target.translate(_CAMEL_SPLIT_TABLE).strip().lower()
         return f"Returns the {words}"
 
     if name.startswith("Set"):
         target = name[3:]  # Remove "Set"
-        words = re.sub('([A-Z])', r' \1', target).strip().lower()
+        words = target.translate(_CAMEL_SPLIT_TABLE).strip().lower()
         return f"Sets the {words}"
 
     if name.startswith("Is") or name.startswith("Has") or name.startswith("Can"):
         target = name[2:] if name.startswith("Is") else name[3:]
-        words = re.sub('([A-Z])', r' \1', target).strip().lower()
+        words = target.translate(_CAMEL_SPLIT_TABLE).strip().lower()
         return f"Checks if {words}"
 
     # If we have parameters, try to describe based on them
@@ -247,12 +307,62 @@ def generate_method_description(method_name: str, params: List[str], return_type
         return f"Performs {method_name} operation with {param_str}"
 
     # Last resort - just describe it generically
-    words = re.sub('([A-Z])', r' \1', name).strip()
+    words = name.translate(_CAMEL_SPLIT_TABLE).strip()
     return f"{words} operation"
 
 
+class _AnnotationRenderer(ast.NodeVisitor):
+    """Render a type annotation or dotted name back to source text.
+
+    Handles the simple forms used in FlexLibs signatures and base classes
+    (names, dotted names, subscripts, literals) directly, dispatching on the
+    node type; anything else falls back to ast.unparse, which gives the same
+    text but is much slower.
+    """
+
+    def generic_visit(self, node) -> str:
+        return ast.unparse(node)
+
+    def visit_Name(self, node) -> str:
+        return node.id
+
+    def visit_Attribute(self, node) -> str:
+        if isinstance(node.value, (ast.Name, ast.Attribute)):
+            return f"{self.visit(node.value)}.{node.attr}"
+        return ast.unparse(node)
+
+    def visit_Subscript(self, node) -> str:
+        if not isinstance(node.value, (ast.Name, ast.Attribute)):
+            return ast.unparse(node)
+        if not isinstance(node.slice, ast.Tuple):
+            inner = self.visit(node.slice)
+        elif len(node.slice.elts) > 1:
+            inner = ", ".join(self.visit(elt) for elt in node.slice.elts)
+        else:
+            return ast.unparse(node)
+        return f"{self.visit(node.value)}[{inner}]"
+
+    def visit_List(self, node) -> str:
+        return f"[{', '.join(self.visit(elt) for elt in node.elts)}]"
+
+    def visit_Constant(self, node) -> str:
+        if node.value is Ellipsis:
+            return "..."
+        elif node.value is None or isinstance(node.value, (bool, int)):
+            return repr(node.value)
+        return ast.unparse(node)
+
+
+_render_annotation = _AnnotationRenderer().visit
+
+
 def get_function_signature(node) -> Tuple[List[str], List[Dict]]:
-    """Extract function signature and parameter details."""
+    """Extract function signature and parameter details.
+
+    Parameter names come from the parser and are already interned; type
+    strings built here are interned too, since the same few types repeat
+    across thousands of parameters.
+    """
     params = []
     param_details = []
 
@@ -267,16 +377,16 @@ def get_function_signature(node) -> Tuple[List[str], List[Dict]]:
         param_str = arg.arg
 
         # Type annotation
-        if hasattr(arg, 'annotation') and arg.annotation:
+        if arg.annotation:
             if isinstance(arg.annotation, ast.Name):
                 param_info["type"] = arg.annotation.id
                 param_str += f": {arg.annotation.id}"
             elif isinstance(arg.annotation, ast.Constant):
-                param_info["type"] = str(arg.annotation.value)
+                param_info["type"] = sys.intern(str(arg.annotation.value))
                 param_str += f": {arg.annotation.value}"
             elif isinstance(arg.annotation, ast.Subscript):
                 # Handle Optional[X], List[X], etc.
-                param_info["type"] = ast.unparse(arg.annotation) if hasattr(ast, 'unparse') else "complex"
+                param_info["type"] = sys.intern(_render_annotation(arg.annotation))
 
         # Default value
         default_idx = i - defaults_start
@@ -295,25 +405,50 @@ def get_function_signature(node) -> Tuple[List[str], List[Dict]]:
     return params, param_details
 
 
+def _collect_lcm_imports(node, imports: List[Dict[str, str]]):
+    """Append SIL imports from a module-level statement to imports.
+
+    Descends into if/try blocks (conditional imports) but not into
+    function or class bodies.
+    """
+    if isinstance(node, ast.ImportFrom):
+        module = node.module or ""
+        if module.startswith("SIL"):
+            for alias in node.names:
+                imports.append({
+                    "module": sys.intern(module),
+                    "name": alias.name,
+                    "alias": alias.asname
+                })
+    elif isinstance(node, ast.If):
+        for child in node.body + node.orelse:
+            _collect_lcm_imports(child, imports)
+    elif isinstance(node, ast.Try):
+        for child in node.body:
+            _collect_lcm_imports(child, imports)
+        for handler in node.handlers:
+            for child in handler.body:
+                _collect_lcm_imports(child, imports)
+        for child in node.orelse + node.finalbody:
+            _collect_lcm_imports(child, imports)
+
+
 def extract_lcm_imports(tree) -> List[Dict[str, str]]:
-    """Extract all SIL.LCModel imports from a module."""
+    """Extract all SIL.LCModel imports from a module.
+
+    Only module-level imports are considered (including conditional imports
+    in top-level if/try blocks); function and class bodies are not scanned.
+    """
     imports = []
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ImportFrom):
-            module = node.module or ""
-            if module.startswith("SIL"):
-                for alias in node.names:
-                    imports.append({
-                        "module": module,
-                        "name": alias.name,
-                        "alias": alias.asname
-                    })
+    for node in tree.body:
+        _collect_lcm_imports(node, imports)
 
     return imports
 
 
-# Known LibLCM property suffixes and their meanings
+# Known LibLCM property suffixes and their meanings (all two letters, so
+# a property is looked up by its last two characters)
 LCM_PROPERTY_SUFFIXES = {
     "OA": "OwningAtomic",      # Single owned object
     "OS": "OwningSequence",    # Ordered list of owned objects
@@ -334,6 +469,24 @@ LCM_UTILITIES = {
     "ITsTextProps": ["GetIntProp", "GetStrProp"],
 }
 
+# Common LibLCM properties recorded whenever they are accessed
+LCM_KNOWN_PROPERTIES = frozenset({
+    "Form", "Gloss", "Definition", "Comment", "CitationForm",
+    "LexemeFormOA", "MorphTypeRA", "PartOfSpeechRA", "Guid", "Hvo",
+    "Owner", "OwningFlid", "ClassID", "ClassName",
+})
+
+# LibLCM MultiString methods
+LCM_MULTISTRING_METHODS = frozenset({
+    "get_String", "set_String", "BestAnalysisAlternative",
+    "BestVernacularAlternative", "CopyAlternatives",
+})
+
+# Methods that create, move or remove LCM objects when called
+LCM_MUTATION_METHODS = frozenset({
+    "Create", "Add", "Delete", "Remove", "Insert", "Clear", "MoveTo",
+})
+
 # Common transformation patterns in FlexLibs2
 TRANSFORMATION_PATTERNS = {
     "hvo_resolution": ["GetObject", "__GetObject", "ObjectOrId", "GetLexEntry", "GetSense"],
@@ -352,7 +505,6 @@ def _extract_default_transformations(node) -> List[Dict[str, str]]:
 
     args = node.args
     defaults = args.defaults
-    kw_defaults = args.kw_defaults if hasattr(args, 'kw_defaults') else []
 
     # Calculate offset for defaults (defaults align to end of args)
     num_args = len(args.args)
@@ -389,70 +541,167 @@ def _get_default_value_str(node) -> str:
             return str(node.value)
     elif isinstance(node, ast.Name):
         return node.id
-    elif isinstance(node, ast.NameConstant):  # Python < 3.8
-        return str(node.value)
-    elif hasattr(ast, 'unparse'):
-        try:
-            return ast.unparse(node)
-        except Exception:
-            pass
-    return ""
+    elif isinstance(node, ast.Attribute):
+        # Dotted names such as cls.DEFAULT or SpecialWritingSystemCodes.X
+        return _render_annotation(node)
+    elif (isinstance(node, ast.Call) and not node.args and not node.keywords
+          and isinstance(node.func, (ast.Name, ast.Attribute))):
+        # Sentinel/empty-container calls such as object() or dict()
+        return f"{_render_annotation(node.func)}()"
+    elif (isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub)
+          and isinstance(node.operand, ast.Constant)
+          and type(node.operand.value) in (int, float)):
+        return f"-{node.operand.value!r}"
+    try:
+        return ast.unparse(node)
+    except Exception:
+        return ""
 
 
-def _track_param_usage(child, param_names: set, param_usage: dict):
-    """Track how parameters are used in LibLCM calls."""
-    if not isinstance(child, ast.Call):
-        return
+class _LcmCallVisitor(ast.NodeVisitor):
+    """Collect LibLCM calls and property accesses made in a method.
 
-    # Get the call target (method name)
-    call_target = ""
-    if isinstance(child.func, ast.Attribute):
-        call_target = child.func.attr
-    elif isinstance(child.func, ast.Name):
-        call_target = child.func.id
+    Each kind of usage is gathered in a dict used as an insertion-ordered
+    set; extract_lcm_calls turns them into the result lists. The same walk
+    records the code features _detect_code_transformations looks for.
+    """
 
-    if not call_target:
-        return
+    def __init__(self, param_names: set, param_usage: dict):
+        self.param_names = param_names
+        self.param_usage = param_usage
+        self.factories_used = {}
+        self.repositories_used = {}
+        self.properties_accessed = {}
+        self.methods_called = {}
+        self.utilities_used = {}
+        self.names = set()    # Referenced names and attribute names
+        self.called = set()   # Names of called functions and methods
+        self.null_coalesce = False
+        self.conditional = False
+
+    def visit_Call(self, node: ast.Call):
+        # Get the call target (method or function name)
+        func = node.func
+        if isinstance(func, ast.Attribute):
+            call_target = func.attr
+        elif isinstance(func, ast.Name):
+            call_target = func.id
+        else:
+            call_target = ""
 
-    # Check arguments for parameter usage
-    for i, arg in enumerate(child.args):
-        if isinstance(arg, ast.Name) and arg.id in param_names:
-            param_name = arg.id
-            usage = f"arg[{i}] of {call_target}()"
-            if param_name not in param_usage:
-                param_usage[param_name] = []
-            if usage not in param_usage[param_name]:
-                param_usage[param_name].append(usage)
-
-    # Check keyword arguments
-    for kw in child.keywords:
-        if isinstance(kw.value, ast.Name) and kw.value.id in param_names:
-            param_name = kw.value.id
-            usage = f"{kw.arg}= of {call_target}()"
-            if param_name not in param_usage:
-                param_usage[param_name] = []
-            if usage not in param_usage[param_name]:
-                param_usage[param_name].append(usage)
-
-
-def _detect_code_transformations(node) -> List[Dict[str, str]]:
-    """Detect transformation patterns in method body."""
-    transformations = []
+        if call_target:
+            self.called.add(call_target)
 
-    try:
-        if hasattr(ast, 'unparse'):
-            source = ast.unparse(node)
-        else:
-            source = ""
-    except Exception:
-        source = ""
+            # Track parameter usage in calls
+            if self.param_names:
+                self._track_param_usage(node, call_target)
 
-    if not source:
-        return transformations
+        # Check for ServiceLocator.GetService(IFactory)
+        if call_target in ("GetService", "GetInstance"):
+            for arg in node.args:
+                if isinstance(arg, ast.Name):
+                    if LCM_FACTORY_PATTERN.match(arg.id):
+                        self.factories_used[arg.id] = None
+                    elif LCM_REPOSITORY_PATTERN.match(arg.id):
+                        self.repositories_used[arg.id] = None
+
+        # Check for ObjectsIn(Repository) pattern
+        elif call_target == "ObjectsIn":
+            for arg in node.args:
+                if isinstance(arg, ast.Name) and LCM_REPOSITORY_PATTERN.match(arg.id):
+                    self.repositories_used[arg.id] = None
+
+        if isinstance(func, ast.Attribute):
+            method_name = call_target
+
+            # Check for utility class calls (TsStringUtils.MakeString, etc.)
+            if isinstance(func.value, ast.Name):
+                class_name = func.value.id
+                if class_name in LCM_UTILITIES:
+                    self.utilities_used[f"{class_name}.{method_name}"] = None
+
+            # Check for .Create(), .Add(), .Delete() calls on LCM objects
+            if method_name in LCM_MUTATION_METHODS:
+                self.methods_called[f".{method_name}()"] = None
+
+        self.generic_visit(node)
+
+    def _track_param_usage(self, node: ast.Call, call_target: str):
+        """Record parameters passed straight into a call."""
+        param_usage = self.param_usage
+
+        # Check positional arguments
+        for i, arg in enumerate(node.args):
+            if isinstance(arg, ast.Name) and arg.id in self.param_names:
+                usages = param_usage.setdefault(arg.id, [])
+                usage = f"arg[{i}] of {call_target}()"
+                if usage not in usages:
+                    usages.append(usage)
+
+        # Check keyword arguments
+        for kw in node.keywords:
+            if isinstance(kw.value, ast.Name) and kw.value.id in self.param_names:
+                usages = param_usage.setdefault(kw.value.id, [])
+                usage = f"{kw.arg}= of {call_target}()"
+                if usage not in usages:
+                    usages.append(usage)
+
+    def visit_Attribute(self, node: ast.Attribute):
+        attr_name = node.attr
+        self.names.add(attr_name)
+
+        # Look for property accesses with LCM suffixes (all two letters)
+        if len(attr_name) > 2:
+            suffix_type = LCM_PROPERTY_SUFFIXES.get(attr_name[-2:])
+            if suffix_type:
+                self.properties_accessed[f"{attr_name} ({suffix_type})"] = None
+
+        # Check for common LCM property patterns
+        if attr_name in LCM_KNOWN_PROPERTIES:
+            self.properties_accessed[attr_name] = None
+
+        # Check for MultiString operations
+        if attr_name in LCM_MULTISTRING_METHODS:
+            self.methods_called[f".{attr_name}()"] = None
+
+        self.generic_visit(node)
+
+    def visit_Name(self, node: ast.Name):
+        self.names.add(node.id)
+
+    def visit_BoolOp(self, node: ast.BoolOp):
+        # "x or ''" / "x or None"
+        if isinstance(node.op, ast.Or):
+            for value in node.values[1:]:
+                if isinstance(value, ast.Constant):
+                    if value.value == "" and isinstance(value.value, str):
+                        self.null_coalesce = True
+                    elif value.value is None:
+                        self.conditional = True
+        self.generic_visit(node)
+
+    def visit_IfExp(self, node: ast.IfExp):
+        self.conditional = True
+        self.generic_visit(node)
+
+
+def _detect_code_transformations(visitor: _LcmCallVisitor) -> List[Dict[str, str]]:
+    """Detect transformation patterns in a method already walked by visitor.
+
+    Only code is inspected: docstrings, other string literals and the
+    method's own name are not.
+    """
+    transformations = []
+
+    # Join the referenced names once so each pattern below is a single
+    # substring search (no pattern contains a newline, so none can match
+    # across two names)
+    names = "\n".join(visitor.names)
 
-    # Check for HVO/object resolution
+    # Check for HVO/object resolution (patterns may be part of a longer
+    # name, e.g. self.__GetSenseObject)
     for pattern in TRANSFORMATION_PATTERNS["hvo_resolution"]:
-        if pattern in source:
+        if pattern in names:
             transformations.append({
                 "type": "hvo_resolution",
                 "pattern": pattern,
@@ -462,7 +711,7 @@ def _detect_code_transformations(node) -> List[Dict[str, str]]:
 
     # Check for writing system default
     for pattern in TRANSFORMATION_PATTERNS["ws_default"]:
-        if pattern in source:
+        if pattern in names:
             transformations.append({
                 "type": "ws_default",
                 "pattern": pattern,
@@ -471,13 +720,13 @@ def _detect_code_transformations(node) -> List[Dict[str, str]]:
             break
 
     # Check for null coalescing
-    if " or ''" in source or ' or ""' in source:
+    if visitor.null_coalesce:
         transformations.append({
             "type": "null_coalesce",
             "pattern": "or ''",
             "description": "Returns empty string instead of None"
         })
-    elif " or None" in source or " if " in source and " else " in source:
+    elif visitor.conditional:
         transformations.append({
             "type": "conditional",
             "description": "Conditional logic for handling special cases"
@@ -485,17 +734,18 @@ def _detect_code_transformations(node) -> List[Dict[str, str]]:
 
     # Check for type conversions
     for pattern in TRANSFORMATION_PATTERNS["type_conversion"]:
-        if pattern in source:
+        func_name = pattern.rstrip("(")
+        if func_name in visitor.called:
             transformations.append({
                 "type": "type_conversion",
-                "pattern": pattern.rstrip("("),
-                "description": f"Converts to {pattern.rstrip('(')}"
+                "pattern": func_name,
+                "description": f"Converts to {func_name}"
             })
 
     return transformations
 
 
-def extract_lcm_calls(node, lcm_imports: List[Dict[str, str]]) -> Dict[str, Any]:
+def extract_lcm_calls(node) -> Dict[str, Any]:
     """
     Extract LibLCM method calls and property accesses from a method body.
 
@@ -532,82 +782,17 @@ def extract_lcm_calls(node, lcm_imports: List[Dict[str, str]]) -> Dict[str, Any]
     if defaults_info:
         result["transformations"].extend(defaults_info)
 
-    # Build set of imported LCM names for faster lookup
-    imported_lcm_names = {imp["name"] for imp in lcm_imports}
-
     # Walk the method body AST
-    for child in ast.walk(node):
-        # Track parameter usage in calls
-        if isinstance(child, ast.Call) and param_names:
-            _track_param_usage(child, param_names, result["param_usage"])
-
-        # Look for GetService calls (factory/repository pattern)
-        if isinstance(child, ast.Call):
-            call_str = _get_call_string(child)
-
-            # Check for ServiceLocator.GetService(IFactory)
-            if "GetService" in call_str or "GetInstance" in call_str:
-                for arg in child.args:
-                    if isinstance(arg, ast.Name):
-                        if LCM_FACTORY_PATTERN.match(arg.id):
-                            if arg.id not in result["factories_used"]:
-                                result["factories_used"].append(arg.id)
-                        elif LCM_REPOSITORY_PATTERN.match(arg.id):
-                            if arg.id not in result["repositories_used"]:
-                                result["repositories_used"].append(arg.id)
-
-            # Check for ObjectsIn(Repository) pattern
-            if "ObjectsIn" in call_str:
-                for arg in child.args:
-                    if isinstance(arg, ast.Name) and LCM_REPOSITORY_PATTERN.match(arg.id):
-                        if arg.id not in result["repositories_used"]:
-                            result["repositories_used"].append(arg.id)
-
-            # Check for utility class calls (TsStringUtils.MakeString, etc.)
-            if isinstance(child.func, ast.Attribute):
-                if isinstance(child.func.value, ast.Name):
-                    class_name = child.func.value.id
-                    method_name = child.func.attr
-                    if class_name in LCM_UTILITIES:
-                        util_str = f"{class_name}.{method_name}"
-                        if util_str not in result["utilities_used"]:
-                            result["utilities_used"].append(util_str)
-
-            # Check for .Create(), .Add(), .Delete() calls on LCM objects
-            if isinstance(child.func, ast.Attribute):
-                method_name = child.func.attr
-                if method_name in ["Create", "Add", "Delete", "Remove", "Insert", "Clear", "MoveTo"]:
-                    method_str = f".{method_name}()"
-                    if method_str not in result["methods_called"]:
-                        result["methods_called"].append(method_str)
-
-        # Look for property accesses with LCM suffixes
-        if isinstance(child, ast.Attribute):
-            attr_name = child.attr
-            # Check if property ends with known LCM suffix
-            for suffix, suffix_type in LCM_PROPERTY_SUFFIXES.items():
-                if attr_name.endswith(suffix) and len(attr_name) > len(suffix):
-                    prop_info = f"{attr_name} ({suffix_type})"
-                    if prop_info not in result["properties_accessed"]:
-                        result["properties_accessed"].append(prop_info)
-                    break
-
-            # Check for common LCM property patterns
-            if attr_name in ["Form", "Gloss", "Definition", "Comment", "CitationForm",
-                            "LexemeFormOA", "MorphTypeRA", "PartOfSpeechRA", "Guid", "Hvo",
-                            "Owner", "OwningFlid", "ClassID", "ClassName"]:
-                if attr_name not in result["properties_accessed"]:
-                    result["properties_accessed"].append(attr_name)
-
-            # Check for MultiString operations
-            if attr_name in ["get_String", "set_String", "BestAnalysisAlternative",
-                            "BestVernacularAlternative", "CopyAlternatives"]:
-                method_str = f".{attr_name}()"
-                if method_str not in result["methods_called"]:
-                    result["methods_called"].append(method_str)
+    visitor = _LcmCallVisitor(param_names, result["param_usage"])
+    visitor.visit(node)
+    result["factories_used"] = list(visitor.factories_used)
+    result["repositories_used"] = list(visitor.repositories_used)
+    result["properties_accessed"] = list(visitor.properties_accessed)
+    result["methods_called"] = list(visitor.methods_called)
+    result["utilities_used"] = list(visitor.utilities_used)
 
     # Detect code-level transformations
-    code_transforms = _detect_code_transformations(node)
+    code_transforms = _detect_code_transformations(visitor)
     if code_transforms:
         result["transformations"].extend(code_transforms)
 
@@ -617,44 +802,9 @@ def extract_lcm_calls(node, lcm_imports: List[Dict[str, str]]) -> Dict[str, Any]
     return result
 
 
-def _get_call_string(node: ast.Call) -> str:
-    """Get a string representation of a call for pattern matching."""
-    try:
-        if hasattr(ast, 'unparse'):
-            return ast.unparse(node.func)
-        elif isinstance(node.func, ast.Attribute):
-            return node.func.attr
-        elif isinstance(node.func, ast.Name):
-            return node.func.id
-    except Exception:
-        pass
-    return ""
-
-
-def _classify_mapping_type(lcm_data: Dict[str, Any]) -> str:
-    """
-    Classify the type of FlexLibs2 -> LibLCM mapping.
-
-    Types:
-    - direct: 1:1 mapping to a single LibLCM call or property access
-    - convenience: Adds validation, defaults, type conversion, or chains properties
-    - composite: Combines multiple distinct LibLCM operations (e.g., create + configure)
-    - pure_python: No LibLCM calls (computation, validation, etc.)
-    """
-    num_factories = len(lcm_data["factories_used"])
-    num_repos = len(lcm_data["repositories_used"])
-    num_props = len(lcm_data["properties_accessed"])
-    num_methods = len(lcm_data["methods_called"])
-    num_utils = len(lcm_data["utilities_used"])
-
-    # Count unique base properties (strip the suffix info for deduplication)
-    unique_props = set()
-    for prop in lcm_data["properties_accessed"]:
-        # Extract just the property name (before " (" if present)
-        base_prop = prop.split(" (")[0]
-        unique_props.add(base_prop)
-    num_unique_props = len(unique_props)
-
+def _classify_counts(num_factories: int, num_repos: int, num_unique_props: int,
+                     num_methods: int, num_utils: int) -> str:
+    """Mapping type rules for _classify_mapping_type, on usage counts."""
     total_lcm_usage = num_factories + num_repos + num_unique_props + num_methods + num_utils
 
     if total_lcm_usage == 0:
@@ -685,24 +835,68 @@ def _classify_mapping_type(lcm_data: Dict[str, Any]) -> str:
     return "convenience"
 
 
-def analyze_method(node, class_name: str, lcm_imports: List[Dict] = None) -> Optional[Dict[str, Any]]:
-    """Analyze a method definition and extract its API information."""
+# No rule distinguishes counts above 3 (the largest threshold is "> 2", and
+# totals are only compared with 0 and 1), so the rules are tabulated once
+# for every combination of counts clamped to 0..3.
+_CLASSIFY_MAX_COUNT = 3
+_CLASSIFIER_TABLE = {
+    (f, r, p, m, u): _classify_counts(f, r, p, m, u)
+    for f in range(_CLASSIFY_MAX_COUNT + 1)
+    for r in range(_CLASSIFY_MAX_COUNT + 1)
+    for p in range(_CLASSIFY_MAX_COUNT + 1)
+    for m in range(_CLASSIFY_MAX_COUNT + 1)
+    for u in range(_CLASSIFY_MAX_COUNT + 1)
+}
+
+
+def _classify_mapping_type(lcm_data: Dict[str, Any]) -> str:
+    """
+    Classify the type of FlexLibs2 -> LibLCM mapping.
+
+    Types:
+    - direct: 1:1 mapping to a single LibLCM call or property access
+    - convenience: Adds validation, defaults, type conversion, or chains properties
+    - composite: Combines multiple distinct LibLCM operations (e.g., create + configure)
+    - pure_python: No LibLCM calls (computation, validation, etc.)
+    """
+    # Count unique base properties: just the property name, before the
+    # " (OwningAtomic)" style suffix info if present
+    num_unique_props = len({prop.split(" (")[0] for prop in lcm_data["properties_accessed"]})
+
+    return _CLASSIFIER_TABLE[(
+        min(len(lcm_data["factories_used"]), _CLASSIFY_MAX_COUNT),
+        min(len(lcm_data["repositories_used"]), _CLASSIFY_MAX_COUNT),
+        min(num_unique_props, _CLASSIFY_MAX_COUNT),
+        min(len(lcm_data["methods_called"]), _CLASSIFY_MAX_COUNT),
+        min(len(lcm_data["utilities_used"]), _CLASSIFY_MAX_COUNT),
+    )]
+
+
+def analyze_method(node, class_name: str,
+                   parse_docs: bool = True) -> Optional[Dict[str, Any]]:
+    """Analyze a method definition and extract its API information.
+
+    With parse_docs=False the docstring is ignored, as if the method had
+    none.
+    """
     if node.name.startswith('_') and node.name != '__init__':
         return None  # Skip private methods except __init__
 
     params, param_details = get_function_signature(node)
-    docstring = extract_docstring(node)
-    parsed_doc = parse_docstring(docstring)
+    if parse_docs:
+        parsed_doc = parse_docstring(extract_docstring(node))
+    else:
+        parsed_doc = _empty_parsed_docstring()
 
     # Extract LibLCM calls from method body
-    lcm_calls = extract_lcm_calls(node, lcm_imports or [])
+    lcm_calls = extract_lcm_calls(node)
 
     # Merge docstring arg info with parameter details
     for param in param_details:
         if param["name"] in parsed_doc["args"]:
             doc_arg = parsed_doc["args"][param["name"]]
             if doc_arg["type"] and not param["type"]:
-                param["type"] = doc_arg["type"]
+                param["type"] = sys.intern(doc_arg["type"])
             param["description"] = doc_arg["description"]
 
     # Check for decorators
@@ -721,17 +915,15 @@ def analyze_method(node, class_name: str, lcm_imports: List[Dict] = None) -> Opt
 
     # Extract return type: prefer type annotation, fallback to docstring
     return_type = ""
-    if hasattr(node, 'returns') and node.returns:
+    if node.returns:
         # Python type hint: def foo() -> Type:
         if isinstance(node.returns, ast.Name):
             return_type = node.returns.id
         elif isinstance(node.returns, ast.Constant):
             return_type = str(node.returns.value)
-        elif isinstance(node.returns, ast.Subscript):
-            # Handle Optional[X], List[X], Iterator[X], etc.
-            return_type = ast.unparse(node.returns) if hasattr(ast, 'unparse') else "complex"
-        elif hasattr(ast, 'unparse'):
-            return_type = ast.unparse(node.returns)
+        else:
+            # Handle Optional[X], List[X], Iterator[X], dotted names, etc.
+            return_type = sys.intern(_render_annotation(node.returns))
 
     # Fallback to docstring-extracted return type
     if not return_type and parsed_doc["return_type"]:
@@ -741,7 +933,8 @@ def analyze_method(node, class_name: str, lcm_imports: List[Dict] = None) -> Opt
     summary = parsed_doc["summary"]
     description = parsed_doc["description"]
     if not description or len(description) < 10:
-        generated_desc = generate_method_description(node.name, params, return_type)
+        # Generated descriptions repeat across classes (same method names)
+        generated_desc = sys.intern(generate_method_description(node.name, params, return_type))
         if not description:
             description = generated_desc
         if not summary:
@@ -767,10 +960,58 @@ def analyze_method(node, class_name: str, lcm_imports: List[Dict] = None) -> Opt
     return method_info
 
 
-def analyze_class(node, module_path: str, lcm_imports: List[Dict]) -> Dict[str, Any]:
-    """Analyze a class definition and extract its API information."""
-    docstring = extract_docstring(node)
-    parsed_doc = parse_docstring(docstring)
+# Module path fragments and their categories, checked in order
+MODULE_PATH_CATEGORIES = (
+    ("Lexicon", "lexicon"),
+    ("Grammar", "grammar"),
+    ("TextsWords", "texts"),
+    ("Notebook", "notebook"),
+    ("Lists", "lists"),
+    ("System", "system"),
+    ("Scripture", "scripture"),
+    ("Discourse", "discourse"),
+    ("Reversal", "reversal"),
+    ("Wordform", "wordform"),
+)
+
+
+def get_category_from_module_path(module_path: str) -> str:
+    """Determine the category of a FlexLibs 2.0 module from its path."""
+    for fragment, category in MODULE_PATH_CATEGORIES:
+        if fragment in module_path:
+            return category
+    return "general"
+
+
+def get_lcm_dependencies(lcm_imports: List[Dict]) -> Tuple[str, ...]:
+    """Get the distinct SIL.LCModel names imported by a module, in import order.
+
+    Names are interned, and the tuple is shared by every class in the module.
+    """
+    return tuple(dict.fromkeys(sys.intern(imp["name"]) for imp in lcm_imports
+                               if imp["module"].startswith("SIL.LCModel")))
+
+
+def analyze_class(node, module_path: str, lcm_imports: List[Dict],
+                  lcm_dependencies: Optional[Tuple[str, ...]] = None,
+                  category: Optional[str] = None,
+                  parse_docs: bool = True) -> Dict[str, Any]:
+    """Analyze a class definition and extract its API information.
+
+    lcm_dependencies and category are per-module values (from
+    get_lcm_dependencies() and get_category_from_module_path()); pass them
+    when analyzing several classes from one module to avoid recomputing
+    them. With parse_docs=False, class and method docstrings are ignored.
+    """
+    if lcm_dependencies is None:
+        lcm_dependencies = get_lcm_dependencies(lcm_imports)
+    if category is None:
+        category = get_category_from_module_path(module_path)
+
+    if parse_docs:
+        parsed_doc = parse_docstring(extract_docstring(node))
+    else:
+        parsed_doc = _empty_parsed_docstring()
 
     # Extract base classes
     base_classes = []
@@ -778,43 +1019,20 @@ def analyze_class(node, module_path: str, lcm_imports: List[Dict]) -> Dict[str,
         if isinstance(base, ast.Name):
             base_classes.append(base.id)
         elif isinstance(base, ast.Attribute):
-            base_classes.append(f"{ast.unparse(base)}" if hasattr(ast, 'unparse') else base.attr)
+            base_classes.append(_render_annotation(base))
 
     methods = []
     properties = []
 
     for item in node.body:
         if isinstance(item, ast.FunctionDef):
-            method_info = analyze_method(item, node.name, lcm_imports)
+            method_info = analyze_method(item, node.name, parse_docs=parse_docs)
             if method_info:
                 if method_info["is_property"]:
                     properties.append(method_info)
                 else:
                     methods.append(method_info)
 
-    # Determine category from module path
-    category = "general"
-    if "Lexicon" in module_path:
-        category = "lexicon"
-    elif "Grammar" in module_path:
-        category = "grammar"
-    elif "TextsWords" in module_path:
-        category = "texts"
-    elif "Notebook" in module_path:
-        category = "notebook"
-    elif "Lists" in module_path:
-        category = "lists"
-    elif "System" in module_path:
-        category = "system"
-    elif "Scripture" in module_path:
-        category = "scripture"
-    elif "Discourse" in module_path:
-        category = "discourse"
-    elif "Reversal" in module_path:
-        category = "reversal"
-    elif "Wordform" in module_path:
-        category = "wordform"
-
     # Build real Python namespace (flexlibs.code.Lexicon.LexEntryOperations)
     namespace = f"flexlibs.code.{module_path.replace('/', '.')}"
 
@@ -827,53 +1045,456 @@ def analyze_class(node, module_path: str, lcm_imports: List[Dict]) -> Dict[str,
         "category": category,
         "summary": parsed_doc["summary"],
         "description": parsed_doc["description"],
-        "usage_hint": generate_entity_usage_hint(node.name, category),
+        # Hints depend only on the name's kind and the category, so most
+        # classes in a category share the same text
+        "usage_hint": sys.intern(generate_entity_usage_hint(node.name, category)),
         "example": parsed_doc["example"],
         "base_classes": base_classes,
-        "methods": sorted(methods, key=lambda m: m["name"]),
+        "methods": sorted(methods, key=itemgetter("name")),
         "properties": properties,
-        "lcm_dependencies": [imp["name"] for imp in lcm_imports if imp["module"].startswith("SIL.LCModel")],
+        "lcm_dependencies": lcm_dependencies,
         "tags": [category, "operations"] if "Operations" in node.name else [category]
     }
 
 
-def analyze_python_file(file_path: Path, base_path: Path) -> Optional[Dict[str, Any]]:
-    """Analyze a single Python file and extract its API structure."""
+# Default location for cached per-file analysis results
+DEFAULT_CACHE_DIR = ".flexlibs2_cache"
+
+# Fingerprint of this analyzer's source and the running Python version, so
+# cached results are invalidated whenever the extraction logic changes or
+# the ast module (and ast.unparse output) may differ
+_ANALYZER_FINGERPRINT = hashlib.blake2b(
+    Path(__file__).read_bytes() + repr(sys.version_info[:2]).encode('ascii'),
+    digest_size=16).digest()
+
+
+def _file_cache_path(cache_dir: Path, content: bytes, rel_path: Path,
+                     parse_docs: bool = True, skip_exceptions: bool = False,
+                     classes_only: bool = False) -> Path:
+    """Get the cache file for a source file's content, relative path and options."""
+    key = hashlib.blake2b(digest_size=16)
+    key.update(_ANALYZER_FINGERPRINT)
+    if not parse_docs:
+        key.update(b'skip-docstrings\0')
+    if skip_exceptions:
+        key.update(b'skip-exceptions\0')
+    if classes_only:
+        key.update(b'classes-only\0')
+    key.update(str(rel_path).encode('utf-8'))
+    key.update(b'\0')
+    key.update(content)
+    return Path(cache_dir) / f"{key.hexdigest()}.json"
+
+
+def _load_cached_file_info(cache_file: Path) -> Optional[Dict[str, Any]]:
+    """Load a cached file_info dict, or None if missing or unreadable."""
+    try:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(cache_file.read_bytes())
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        # (orjson.JSONDecodeError is a ValueError)
+        return None
+
+
+def _store_cached_file_info(cache_file: Path, file_info: Dict[str, Any]):
+    """Write a file_info dict to the cache (best effort, atomic replace)."""
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        if ORJSON_AVAILABLE:
+            tmp_file.write_bytes(orjson.dumps(file_info))
+        else:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(file_info, f, ensure_ascii=False)
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+
+
+# A top-level class statement (ClassDefs in tree.body start at column 0)
+_TOP_LEVEL_CLASS_RE = re.compile(rb'^class\b', re.MULTILINE)
+
+# Exception classes in FlexLibs stable (FP_* are FLExProject's exceptions);
+# they are not API, so analyze_python_file can skip them
+_EXCEPTION_CLASS_RE = re.compile(r'Error|Exception|^FP_')
+
+
+def analyze_python_file(file_path: Path, base_path: Path,
+                        cache_dir: Optional[Path] = None,
+                        classes_only: bool = False,
+                        parse_docs: bool = True,
+                        skip_exceptions: bool = False) -> Optional[Dict[str, Any]]:
+    """Analyze a single Python file and extract its API structure.
+
+    If cache_dir is given, results are cached there keyed by the file's
+    content and relative path, so unchanged files are not re-parsed.
+    If classes_only is True, files with no top-level class statement are
+    skipped without parsing and None is returned, and top-level functions
+    are not analyzed. If parse_docs is False,
+    docstrings are not parsed (summaries, examples etc. are left empty and
+    descriptions are generated from the names). If skip_exceptions is
+    True, exception classes (see _EXCEPTION_CLASS_RE) are left out without
+    being analyzed.
+    """
+    return _analyze_python_file(file_path, base_path, cache_dir, classes_only,
+                                parse_docs, skip_exceptions)[0]
+
+
+def _analyze_python_file(file_path: Path, base_path: Path,
+                         cache_dir: Optional[Path] = None,
+                         classes_only: bool = False,
+                         parse_docs: bool = True,
+                         skip_exceptions: bool = False
+                         ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """analyze_python_file(), also returning the name of the file's cache file.
+
+    The name is "" for files skipped by classes_only, and None if the file
+    could not be analyzed or no cache_dir was given.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        raw = file_path.read_bytes()
 
-        tree = ast.parse(content)
+        if classes_only and not _TOP_LEVEL_CLASS_RE.search(raw):
+            return None, ""
 
         # Get relative path for module identification
         rel_path = file_path.relative_to(base_path)
         module_path = str(rel_path.with_suffix('')).replace('\\', '/')
 
-        lcm_imports = extract_lcm_imports(tree)
+        cache_file = None
+        if cache_dir is not None:
+            cache_file = _file_cache_path(cache_dir, raw, rel_path, parse_docs,
+                                          skip_exceptions, classes_only)
+            cached = _load_cached_file_info(cache_file)
+            if cached is not None:
+                return cached, cache_file.name
+
+        # Equivalent to ast.parse (no type comments, docstrings kept) minus the
+        # wrapper; compile decodes the bytes itself, honoring BOMs and coding
+        # cookies.
+        tree = compile(raw, str(file_path), 'exec', flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+
+        # Single pass over the module body: collect LCM imports, top-level
+        # classes and (unless classes_only) public top-level functions
+        # together. Classes and functions are analyzed afterwards so they see
+        # every import in the file.
+        lcm_imports = []
+        class_nodes = []
+        function_nodes = []
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                if not (skip_exceptions and _EXCEPTION_CLASS_RE.search(node.name)):
+                    class_nodes.append(node)
+            elif isinstance(node, ast.FunctionDef):
+                if not (classes_only or node.name.startswith('_')):
+                    function_nodes.append(node)
+            else:
+                _collect_lcm_imports(node, lcm_imports)
+
+        lcm_dependencies = get_lcm_dependencies(lcm_imports)
+        category = get_category_from_module_path(module_path)
 
         file_info = {
             "file": str(rel_path),
             "module_path": module_path,
-            "docstring": extract_docstring(tree),
+            "docstring": extract_docstring(tree) if parse_docs else "",
             "classes": [],
-            "lcm_imports": lcm_imports
+            "functions": [],
+            "lcm_imports": lcm_imports,
+            "lcm_dependencies": lcm_dependencies
         }
 
-        # Find top-level classes
-        for node in tree.body:
-            if isinstance(node, ast.ClassDef):
-                class_info = analyze_class(node, module_path, lcm_imports)
-                file_info["classes"].append(class_info)
+        for node in class_nodes:
+            class_info = analyze_class(node, module_path, lcm_imports, lcm_dependencies,
+                                       category, parse_docs)
+            file_info["classes"].append(class_info)
+
+        for node in function_nodes:
+            func_info = analyze_method(node, "", parse_docs=parse_docs)
+            if func_info:
+                file_info["functions"].append(func_info)
+
+        if cache_file is None:
+            return file_info, None
 
-        return file_info
+        _store_cached_file_info(cache_file, file_info)
+        return file_info, cache_file.name
 
     except Exception as e:
         print(f"[WARN] Error analyzing {file_path}: {e}")
-        return None
+        return None, None
+
+
+def _options_cache_dir(cache_dir, classes_only: bool, parse_docs: bool,
+                       skip_exceptions: bool) -> Path:
+    """Get the subdirectory of a cache directory for a set of options.
+
+    Each analyzer version and set of options has its own subdirectory,
+    holding its manifest and the cache files the manifest points to, so
+    _prune_cache can clear out one without touching the others.
+    """
+    options = bytes([classes_only, parse_docs, skip_exceptions]).hex()
+    return Path(cache_dir) / f"{_ANALYZER_FINGERPRINT.hex()}-{options}"
+
+
+_MANIFEST_NAME = "manifest.json"
+
+# Names _prune_cache may delete from the top of a cache directory: option
+# subdirectories and the flat cache and manifest files of earlier versions
+_CACHE_SUBDIR_RE = re.compile(r'[0-9a-f]{32}-[0-9a-f]{6}')
+_FLAT_CACHE_FILE_RE = re.compile(r'(?:[0-9a-f]{32}|manifest-[0-9a-f]{16})\.json')
+
+
+def _prune_cache(cache_dir, options_dir: Path, manifest: Dict[str, List]):
+    """Delete cache files the new manifest does not point to (best effort).
+
+    In options_dir, every cache file the manifest does not name is removed.
+    At the top of cache_dir, subdirectories written by other analyzer
+    versions are removed, as are cache files from before subdirectories
+    were used. Other files are left alone, in case cache_dir is shared.
+    """
+    keep = {entry[2] for entry in manifest.values()}
+    keep.add(_MANIFEST_NAME)
+    current = f"{_ANALYZER_FINGERPRINT.hex()}-"
+    try:
+        with os.scandir(options_dir) as it:
+            stale = [entry.path for entry in it
+                     if entry.name.endswith(".json") and entry.name not in keep]
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if (_CACHE_SUBDIR_RE.fullmatch(entry.name)
+                        and not entry.name.startswith(current)
+                        and entry.is_dir(follow_symlinks=False)):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                elif _FLAT_CACHE_FILE_RE.fullmatch(entry.name):
+                    stale.append(entry.path)
+    except OSError:
+        return
+    for path in stale:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _load_manifest(manifest_file: Path) -> Dict[str, List]:
+    """Load a manifest ({path: [mtime_ns, size, cache file name]}), or {}."""
+    manifest = _load_cached_file_info(manifest_file)
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _analyze_python_file_stamped(file_path: Path, prior: Optional[List] = None,
+                                 **kwargs) -> Tuple[Optional[Dict[str, Any]], Optional[List]]:
+    """_analyze_python_file() behind a manifest check.
+
+    prior is the file's manifest entry from the previous run. If the file's
+    mtime and size still match it, the cached file_info it names is reused
+    without opening the source file. Otherwise the file is analyzed as
+    usual (the content-keyed cache still catches files that were touched
+    but not changed). Returns the file_info and the file's new manifest
+    entry, or None if it should not be recorded.
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return analyze_python_file(file_path, **kwargs), None
+    stamp = [st.st_mtime_ns, st.st_size]
+
+    if prior is not None and prior[:2] == stamp:
+        if prior[2] == "":
+            return None, prior
+        cached = _load_cached_file_info(Path(kwargs["cache_dir"]) / prior[2])
+        if cached is not None:
+            return cached, prior
+
+    file_info, cache_name = _analyze_python_file(file_path, **kwargs)
+    if cache_name is None:
+        return file_info, None
+    return file_info, stamp + [cache_name]
+
+
+def _walk_py(directory, recursive: bool = True) -> Iterator[Path]:
+    """Yield the .py files under a directory, skipping __*.py files.
+
+    Uses os.scandir so each entry's type comes from the directory listing.
+    Files in a directory are yielded before its subdirectories are walked,
+    the same order as Path.rglob (or Path.glob if recursive is False).
+    Symlinked directories are not followed.
+    """
+    with os.scandir(directory) as it:
+        entries = list(it)
+
+    for entry in entries:
+        if (entry.name.endswith(".py") and not entry.name.startswith("__")
+                and entry.is_file()):
+            yield Path(entry.path)
+
+    if not recursive:
+        return
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_py(entry.path)
 
 
-def analyze_flexlibs2(flexlibs2_path: str) -> Dict[str, Any]:
-    """Analyze the entire FlexLibs 2.0 codebase."""
+# Below this many files, starting worker processes costs more than it saves
+_MIN_FILES_FOR_POOL = 4
+
+# How worker processes are started (see _analyze_files)
+_SPAWN = multiprocessing.get_context("spawn")
+
+
+def _analyze_files(py_files: List[Path], base_path: Path, cache_dir: Optional[str] = None,
+                   jobs: Optional[int] = None,
+                   classes_only: bool = False,
+                   parse_docs: bool = True,
+                   skip_exceptions: bool = False) -> Iterator[Optional[Dict[str, Any]]]:
+    """Yield analyze_python_file() results for py_files, in order.
+
+    Files are analyzed in jobs worker processes (default: one per CPU), or
+    in this process for jobs=1 and for only a few files. Workers are always
+    spawned, not forked: main() may be called from a thread of a process
+    that runs other threads (refresh.py --in-process), and forking that is
+    unsafe.
+
+    With a cache_dir, a manifest of each file's mtime, size and cache file
+    is kept there, so files unchanged since the last run are not even read
+    (see _analyze_python_file_stamped). The manifest is written once the
+    results have all been consumed, listing only py_files, and cache files
+    it no longer points to are then deleted (see _prune_cache).
+    """
+    kwargs = dict(base_path=base_path, cache_dir=cache_dir, classes_only=classes_only,
+                  parse_docs=parse_docs, skip_exceptions=skip_exceptions)
+    workers = jobs or os.cpu_count() or 1
+    in_process = workers == 1 or len(py_files) < _MIN_FILES_FOR_POOL
+
+    if cache_dir is None:
+        analyze = partial(analyze_python_file, **kwargs)
+        if in_process:
+            yield from map(analyze, py_files)
+            return
+        # Small chunks keep the workers evenly loaded (files vary a lot in size)
+        chunksize = max(1, len(py_files) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_SPAWN) as executor:
+            yield from executor.map(analyze, py_files, chunksize=chunksize)
+        return
+
+    options_dir = _options_cache_dir(cache_dir, classes_only, parse_docs, skip_exceptions)
+    options_dir.mkdir(parents=True, exist_ok=True)
+    manifest_file = options_dir / _MANIFEST_NAME
+    prior_manifest = _load_manifest(manifest_file)
+    keys = [os.path.abspath(py_file) for py_file in py_files]
+    priors = [prior_manifest.get(key) for key in keys]
+    manifest = {}
+    kwargs["cache_dir"] = options_dir
+    analyze = partial(_analyze_python_file_stamped, **kwargs)
+
+    if in_process:
+        results = map(analyze, py_files, priors)
+        yield from _record_stamps(results, keys, manifest)
+    else:
+        chunksize = max(1, len(py_files) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_SPAWN) as executor:
+            results = executor.map(analyze, py_files, priors, chunksize=chunksize)
+            yield from _record_stamps(results, keys, manifest)
+
+    _store_cached_file_info(manifest_file, manifest)
+    _prune_cache(cache_dir, options_dir, manifest)
+
+
+def _record_stamps(results, keys: List[str], manifest: Dict[str, List]
+                   ) -> Iterator[Optional[Dict[str, Any]]]:
+    """Yield the file_infos from (file_info, entry) results, updating manifest."""
+    for key, (file_info, entry) in zip(keys, results):
+        if entry is None:
+            manifest.pop(key, None)
+        else:
+            manifest[key] = entry
+        yield file_info
+
+
+_EMPTY: Tuple[str, ...] = ()
+_EMPTY_MAP: Mapping[str, Any] = MappingProxyType({})  # for methods with no lcm_mapping
+
+
+def build_lcm_mapping(lcm_rows: List[Tuple[str, Dict[str, Any], Tuple[str, ...]]]) -> Dict[str, Any]:
+    """Build the lcm_mapping index from (class name, method_info, lcm_dependencies) rows.
+
+    Keys are "Class.method"; a later row for the same key replaces the
+    earlier one. Missing lists share the _EMPTY tuple (and a missing
+    lcm_mapping the _EMPTY_MAP mapping) rather than allocating a fresh
+    default per field and method.
+    """
+    lcm_mapping = {}
+    for entity_id, method, lcm_deps in lcm_rows:
+        lcm_info = method.get("lcm_mapping") or _EMPTY_MAP
+        name = method["name"]
+        lcm_mapping[f"{entity_id}.{name}"] = {
+            "class": entity_id,
+            "method": name,
+            "mapping_type": lcm_info.get("mapping_type", "pure_python"),
+            "factories_used": lcm_info.get("factories_used") or _EMPTY,
+            "repositories_used": lcm_info.get("repositories_used") or _EMPTY,
+            "properties_accessed": lcm_info.get("properties_accessed") or _EMPTY,
+            "methods_called": lcm_info.get("methods_called") or _EMPTY,
+            "utilities_used": lcm_info.get("utilities_used") or _EMPTY,
+            "lcm_deps": lcm_deps
+        }
+    return lcm_mapping
+
+
+def _aggregate_classes(classes: List[Dict[str, Any]], result: Dict[str, Any]
+                       ) -> List[Tuple[str, Dict[str, Any], Tuple[str, ...]]]:
+    """Add analyzed classes to result's entities and metadata totals.
+
+    Counting is done in bulk (dict.update, sum, Counter) over the whole list,
+    and added to any counts already in result.
+    Returns the (class name, method_info, lcm_dependencies) rows for
+    build_lcm_mapping, one per method.
+    """
+    meta = result["metadata"]
+    result["entities"].update((c["name"], c) for c in classes)
+    meta["total_classes"] += len(classes)
+    meta["total_methods"] += sum(len(c["methods"]) for c in classes)
+    meta["total_properties"] += sum(len(c.get("properties", _EMPTY)) for c in classes)
+    categories = meta["categories"]
+    for cat, count in Counter(c["category"] for c in classes).items():
+        categories[cat] = categories.get(cat, 0) + count
+    # (a class's lcm_dependencies are its file's, shared by its classes)
+    meta["lcm_interfaces_used"].update(
+        chain.from_iterable(c["lcm_dependencies"] for c in classes))
+
+    lcm_rows = []
+    for class_info in classes:
+        entity_id = class_info["name"]
+        lcm_deps = class_info["lcm_dependencies"]
+        lcm_rows.extend([(entity_id, method, lcm_deps) for method in class_info["methods"]])
+
+    meta["methods_with_return_type"] += sum(
+        1 for _, method, _ in lcm_rows if method.get("return_type"))
+    mapping_types = meta["mapping_types"]
+    counts = Counter(method.get("lcm_mapping", _EMPTY_MAP).get("mapping_type", "pure_python")
+                     for _, method, _ in lcm_rows)
+    for mapping_type, count in counts.items():
+        if mapping_type in mapping_types:
+            mapping_types[mapping_type] += count
+
+    return lcm_rows
+
+
+def analyze_flexlibs2(flexlibs2_path: str, cache_dir: Optional[str] = None,
+                      jobs: Optional[int] = None, parse_docs: bool = True,
+                      generated_at: Optional[str] = None) -> Dict[str, Any]:
+    """Analyze the entire FlexLibs 2.0 codebase.
+
+    jobs is the number of worker processes (default: one per CPU).
+    parse_docs=False skips docstring parsing (see analyze_python_file).
+    generated_at is the ISO timestamp to record (default: now).
+    """
     base_path = Path(flexlibs2_path) / "flexlibs2" / "code"
 
     if not base_path.exists():
@@ -881,9 +1502,12 @@ def analyze_flexlibs2(flexlibs2_path: str) -> Dict[str, Any]:
 
     print(f"[INFO] Analyzing FlexLibs 2.0 at: {base_path}")
 
+    if cache_dir is not None:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+
     result = {
         "_schema": "unified-api-doc/2.0",
-        "_generated_at": datetime.now(timezone.utc).isoformat(),
+        "_generated_at": generated_at or datetime.now(timezone.utc).isoformat(),
         "_source": {
             "type": "flexlibs2",
             "path": str(flexlibs2_path),
@@ -906,58 +1530,23 @@ def analyze_flexlibs2(flexlibs2_path: str) -> Dict[str, Any]:
         },
         "entities": {},
         "categories": {},
-        "lcm_mapping": {}  # Maps FlexLibs2 methods to LibLCM interfaces
+        "lcm_mapping": {}  # Maps FlexLibs2 methods to LibLCM interfaces (see build_lcm_mapping)
     }
 
-    # Analyze all Python files recursively
-    for py_file in base_path.rglob("*.py"):
-        if py_file.name.startswith("__"):
-            continue
+    # Analyze all Python files recursively. Each file is parsed independently,
+    # so fan the CPU-bound work out across processes, then aggregate the
+    # classes in one batch.
+    py_files = list(_walk_py(base_path))
+
+    file_infos = _analyze_files(py_files, base_path, cache_dir, jobs, classes_only=True,
+                                parse_docs=parse_docs)
+    file_infos = [fi for fi in file_infos if fi and fi["classes"]]
 
-        file_info = analyze_python_file(py_file, base_path)
-        if file_info and file_info["classes"]:
-            result["metadata"]["files_analyzed"] += 1
-
-            for class_info in file_info["classes"]:
-                entity_id = class_info["name"]
-                result["entities"][entity_id] = class_info
-                result["metadata"]["total_classes"] += 1
-                result["metadata"]["total_methods"] += len(class_info["methods"])
-                result["metadata"]["total_properties"] += len(class_info["properties"])
-                # Count methods with return types and mapping types
-                for method in class_info["methods"]:
-                    if method.get("return_type"):
-                        result["metadata"]["methods_with_return_type"] += 1
-                    # Count mapping types
-                    mapping_type = method.get("lcm_mapping", {}).get("mapping_type", "pure_python")
-                    if mapping_type in result["metadata"]["mapping_types"]:
-                        result["metadata"]["mapping_types"][mapping_type] += 1
-
-                # Track categories
-                cat = class_info["category"]
-                if cat not in result["metadata"]["categories"]:
-                    result["metadata"]["categories"][cat] = 0
-                result["metadata"]["categories"][cat] += 1
-
-                # Track LCM dependencies
-                for dep in class_info["lcm_dependencies"]:
-                    result["metadata"]["lcm_interfaces_used"].add(dep)
-
-                # Build LCM mapping with detailed method-level info
-                for method in class_info["methods"]:
-                    method_key = f"{entity_id}.{method['name']}"
-                    lcm_info = method.get("lcm_mapping", {})
-                    result["lcm_mapping"][method_key] = {
-                        "class": entity_id,
-                        "method": method["name"],
-                        "mapping_type": lcm_info.get("mapping_type", "pure_python"),
-                        "factories_used": lcm_info.get("factories_used", []),
-                        "repositories_used": lcm_info.get("repositories_used", []),
-                        "properties_accessed": lcm_info.get("properties_accessed", []),
-                        "methods_called": lcm_info.get("methods_called", []),
-                        "utilities_used": lcm_info.get("utilities_used", []),
-                        "lcm_deps": class_info["lcm_dependencies"]
-                    }
+    result["metadata"]["files_analyzed"] += len(file_infos)
+    lcm_rows = _aggregate_classes(
+        list(chain.from_iterable(fi["classes"] for fi in file_infos)), result)
+
+    result["lcm_mapping"] = build_lcm_mapping(lcm_rows)
 
     # Convert set to list for JSON serialization
     result["metadata"]["lcm_interfaces_used"] = sorted(list(result["metadata"]["lcm_interfaces_used"]))
@@ -975,27 +1564,34 @@ def analyze_flexlibs2(flexlibs2_path: str) -> Dict[str, Any]:
     return result
 
 
+# FlexLibs stable method name prefixes and their categories, checked in order
+METHOD_NAME_CATEGORIES = (
+    ("Lexicon", "lexicon"),
+    ("Text", "texts"),
+    ("Reversal", "reversal"),
+    ("Wordform", "wordform"),
+    ("WS", "system"),        # Writing system methods
+    ("Object", "system"),    # Generic object methods
+    ("Get", "general"),      # Generic getters (GetAllSemanticDomains, etc.)
+    ("Build", "general"),    # Utility methods
+    ("Unpack", "general"),   # Utility methods
+)
+
+# All the prefixes as one anchored alternation; re tries alternatives in
+# order, so the match is the first prefix in table order, as a loop would be
+_METHOD_NAME_PREFIX_RE = re.compile("|".join(re.escape(prefix) for prefix, _ in METHOD_NAME_CATEGORIES))
+_METHOD_NAME_PREFIX_CATEGORIES = dict(METHOD_NAME_CATEGORIES)
+
+
 def get_category_from_method_name(method_name: str) -> str:
     """
     Determine category from FlexLibs stable method name prefix.
 
     FlexLibs stable uses method prefixes like Lexicon*, Text*, Reversal*, etc.
     """
-    prefixes = {
-        "Lexicon": "lexicon",
-        "Text": "texts",
-        "Reversal": "reversal",
-        "Wordform": "wordform",
-        "WS": "system",        # Writing system methods
-        "Object": "system",    # Generic object methods
-        "Get": "general",      # Generic getters (GetAllSemanticDomains, etc.)
-        "Build": "general",    # Utility methods
-        "Unpack": "general",   # Utility methods
-    }
-
-    for prefix, category in prefixes.items():
-        if method_name.startswith(prefix):
-            return category
+    prefix_match = _METHOD_NAME_PREFIX_RE.match(method_name)
+    if prefix_match:
+        return _METHOD_NAME_PREFIX_CATEGORIES[prefix_match.group()]
 
     # Check for specific patterns
     if "WritingSystem" in method_name or "WS" in method_name:
@@ -1008,8 +1604,15 @@ def get_category_from_method_name(method_name: str) -> str:
     return "general"
 
 
-def analyze_flexlibs_stable(flexlibs_path: str) -> Dict[str, Any]:
-    """Analyze the FlexLibs stable codebase (single FLExProject class)."""
+def analyze_flexlibs_stable(flexlibs_path: str, cache_dir: Optional[str] = None,
+                            jobs: Optional[int] = None, parse_docs: bool = True,
+                            generated_at: Optional[str] = None) -> Dict[str, Any]:
+    """Analyze the FlexLibs stable codebase (single FLExProject class).
+
+    jobs is the number of worker processes (default: one per CPU).
+    parse_docs=False skips docstring parsing (see analyze_python_file).
+    generated_at is the ISO timestamp to record (default: now).
+    """
     code_path = Path(flexlibs_path) / "flexlibs" / "code"
 
     if not code_path.exists():
@@ -1017,9 +1620,12 @@ def analyze_flexlibs_stable(flexlibs_path: str) -> Dict[str, Any]:
 
     print(f"[INFO] Analyzing FlexLibs stable at: {code_path}")
 
+    if cache_dir is not None:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+
     result = {
         "_schema": "unified-api-doc/2.0",
-        "_generated_at": datetime.now(timezone.utc).isoformat(),
+        "_generated_at": generated_at or datetime.now(timezone.utc).isoformat(),
         "_source": {
             "type": "flexlibs",
             "path": str(flexlibs_path),
@@ -1048,96 +1654,52 @@ def analyze_flexlibs_stable(flexlibs_path: str) -> Dict[str, Any]:
     }
 
     # Analyze Python files in code directory (non-recursive for stable)
-    for py_file in code_path.glob("*.py"):
-        if py_file.name.startswith("__"):
-            continue
-
-        file_info = analyze_python_file(py_file, code_path)
+    py_files = list(_walk_py(code_path, recursive=False))
+    # Exception classes are not API; they are dropped before analysis
+    file_infos = _analyze_files(py_files, code_path, cache_dir, jobs,
+                                parse_docs=parse_docs, skip_exceptions=True)
+
+    # Per-file work (functions, and the method categories that the class
+    # category depends on) happens here; the classes are then aggregated in
+    # one batch.
+    functions = result["functions"]
+    files_analyzed = 0
+    all_classes = []
+
+    # file_infos first, so it is run to completion (see _analyze_files)
+    for file_info, py_file in zip(file_infos, py_files):
         if not file_info:
             continue
 
-        result["metadata"]["files_analyzed"] += 1
+        files_analyzed += 1
 
-        # Extract top-level functions
-        try:
-            with open(py_file, 'r', encoding='utf-8') as f:
-                tree = ast.parse(f.read())
-
-            lcm_imports = extract_lcm_imports(tree)
-
-            for node in tree.body:
-                if isinstance(node, ast.FunctionDef) and not node.name.startswith('_'):
-                    func_info = analyze_method(node, "", lcm_imports)
-                    if func_info:
-                        func_info["source_file"] = py_file.name
-                        func_info["category"] = get_category_from_method_name(node.name)
-                        result["functions"].append(func_info)
-                        result["metadata"]["total_functions"] += 1
-        except Exception as e:
-            print(f"[WARN] Error extracting functions from {py_file}: {e}")
-
-        # Process classes
-        for class_info in file_info.get("classes", []):
-            entity_id = class_info["name"]
-
-            # Skip exception classes (they're not API)
-            if ("Error" in entity_id or "Exception" in entity_id or
-                entity_id.startswith("FP_")):
-                continue
+        # Top-level functions (analyzed along with the classes)
+        for func_info in file_info["functions"]:
+            func_info["source_file"] = py_file.name
+            func_info["category"] = get_category_from_method_name(func_info["name"])
+        functions.extend(file_info["functions"])
 
-            # For FlexLibs stable, categorize methods by their name prefix
-            method_categories = {}
+        # For FlexLibs stable, categorize methods by their name prefix and
+        # set the class category to the most common method category
+        for class_info in file_info["classes"]:
+            method_categories = Counter()
             for method in class_info["methods"]:
                 cat = get_category_from_method_name(method["name"])
                 method["category"] = cat
-                if cat not in method_categories:
-                    method_categories[cat] = 0
                 method_categories[cat] += 1
 
-            # Set class category based on most common method category
             if method_categories:
                 class_info["category"] = max(method_categories, key=method_categories.get)
             else:
                 class_info["category"] = "general"
+        all_classes.extend(file_info["classes"])
 
-            result["entities"][entity_id] = class_info
-            result["metadata"]["total_classes"] += 1
-            result["metadata"]["total_methods"] += len(class_info["methods"])
-            result["metadata"]["total_properties"] += len(class_info.get("properties", []))
+    meta = result["metadata"]
+    meta["files_analyzed"] += files_analyzed
+    meta["total_functions"] += len(functions)
+    lcm_rows = _aggregate_classes(all_classes, result)
 
-            # Count methods with return types and mapping types
-            for method in class_info["methods"]:
-                if method.get("return_type"):
-                    result["metadata"]["methods_with_return_type"] += 1
-                mapping_type = method.get("lcm_mapping", {}).get("mapping_type", "pure_python")
-                if mapping_type in result["metadata"]["mapping_types"]:
-                    result["metadata"]["mapping_types"][mapping_type] += 1
-
-            # Track categories
-            cat = class_info["category"]
-            if cat not in result["metadata"]["categories"]:
-                result["metadata"]["categories"][cat] = 0
-            result["metadata"]["categories"][cat] += 1
-
-            # Track LCM dependencies
-            for dep in class_info.get("lcm_dependencies", []):
-                result["metadata"]["lcm_interfaces_used"].add(dep)
-
-            # Build LCM mapping
-            for method in class_info["methods"]:
-                method_key = f"{entity_id}.{method['name']}"
-                lcm_info = method.get("lcm_mapping", {})
-                result["lcm_mapping"][method_key] = {
-                    "class": entity_id,
-                    "method": method["name"],
-                    "mapping_type": lcm_info.get("mapping_type", "pure_python"),
-                    "factories_used": lcm_info.get("factories_used", []),
-                    "repositories_used": lcm_info.get("repositories_used", []),
-                    "properties_accessed": lcm_info.get("properties_accessed", []),
-                    "methods_called": lcm_info.get("methods_called", []),
-                    "utilities_used": lcm_info.get("utilities_used", []),
-                    "lcm_deps": class_info.get("lcm_dependencies", [])
-                }
+    result["lcm_mapping"] = build_lcm_mapping(lcm_rows)
 
     # Convert set to list for JSON serialization
     result["metadata"]["lcm_interfaces_used"] = sorted(list(result["metadata"]["lcm_interfaces_used"]))
@@ -1155,6 +1717,18 @@ def analyze_flexlibs_stable(flexlibs_path: str) -> Dict[str, Any]:
     return result
 
 
+@lru_cache(maxsize=4)
+def _load_liblcm_index(liblcm_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Load a LibLCM index JSON file (cached; the result must not be modified).
+
+    mtime_ns is only part of the cache key, so a rewritten file is reloaded.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(Path(liblcm_path).read_bytes())
+    with open(liblcm_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 def cross_reference_liblcm(flexlibs_data: Dict[str, Any], liblcm_path: str = None) -> Dict[str, Any]:
     """
     Cross-reference FlexLibs lcm_mapping with LibLCM index to validate references.
@@ -1175,8 +1749,8 @@ def cross_reference_liblcm(flexlibs_data: Dict[str, Any], liblcm_path: str = Non
             return {"error": "LibLCM index not found", "validated": False}
 
     try:
-        with open(liblcm_path, 'r', encoding='utf-8') as f:
-            liblcm_data = json.load(f)
+        # The index is large and shared by the stable and 2.0 reports
+        liblcm_data = _load_liblcm_index(str(liblcm_path), os.stat(liblcm_path).st_mtime_ns)
     except Exception as e:
         return {"error": f"Failed to load LibLCM index: {e}", "validated": False}
 
@@ -1210,29 +1784,19 @@ def cross_reference_liblcm(flexlibs_data: Dict[str, Any], liblcm_path: str = Non
                     # This is a relationship property - we'd need type info to know the target
                     pass
 
-    # Validate factories
-    for factory in all_factories:
-        if factory in liblcm_entities:
-            report["factories"]["found"].append(factory)
-        else:
-            report["factories"]["missing"].append(factory)
-
-    # Validate repositories
-    for repo in all_repos:
-        if repo in liblcm_entities:
-            report["repositories"]["found"].append(repo)
-        else:
-            report["repositories"]["missing"].append(repo)
-
     # Check interfaces from lcm_interfaces_used
-    for iface in flexlibs_data.get("metadata", {}).get("lcm_interfaces_used", []):
-        if iface in liblcm_entities:
-            report["interfaces"]["found"].append(iface)
-        else:
-            report["interfaces"]["missing"].append(iface)
+    interfaces_used = flexlibs_data.get("metadata", {}).get("lcm_interfaces_used", [])
+    all_interfaces.update(interfaces_used)
+
+    # Validate factories, repositories and interfaces against the index
+    for kind, names in (("factories", all_factories),
+                        ("repositories", all_repos),
+                        ("interfaces", all_interfaces)):
+        report[kind]["found"] = sorted(names & liblcm_entities)
+        report[kind]["missing"] = sorted(names - liblcm_entities)
 
     # Calculate coverage
-    total_refs = len(all_factories) + len(all_repos) + len(flexlibs_data.get("metadata", {}).get("lcm_interfaces_used", []))
+    total_refs = len(all_factories) + len(all_repos) + len(interfaces_used)
     found_refs = len(report["factories"]["found"]) + len(report["repositories"]["found"]) + len(report["interfaces"]["found"])
     report["coverage"] = {
         "total_references": total_refs,
@@ -1264,7 +1828,24 @@ def print_summary(api_data: Dict[str, Any], version: str):
         print(f"    {cat}: {count} classes")
 
 
-def main():
+def write_json(data: Dict[str, Any], output_file: str):
+    """Write API data as pretty-printed UTF-8 JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        try:
+            encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; let the json module handle it
+        else:
+            with open(output_file, 'wb') as f:
+                f.write(encoded)
+            return
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point; argv defaults to sys.argv[1:]."""
     import argparse
 
     parser = argparse.ArgumentParser(description="Analyze FlexLibs Python API")
@@ -1277,19 +1858,37 @@ def main():
     parser.add_argument("--output", "-o",
                         default=None,
                         help="Output JSON file")
-
-    args = parser.parse_args()
+    parser.add_argument("--cache-dir",
+                        default=DEFAULT_CACHE_DIR,
+                        help=f"Directory for cached per-file analysis (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--no-cache",
+                        action="store_true",
+                        help="Analyze every file from scratch without reading or writing the cache")
+    parser.add_argument("--jobs", "-j",
+                        type=int,
+                        default=None,
+                        help="Number of worker processes (default: one per CPU; 1 = no workers)")
+    parser.add_argument("--skip-docstrings",
+                        action="store_true",
+                        help="Don't parse docstrings (faster; summaries, examples and "
+                             "parameter docs are left empty)")
+
+    args = parser.parse_args(argv)
+    cache_dir = None if args.no_cache else args.cache_dir
+    parse_docs = not args.skip_docstrings
+    # One timestamp for the run, so indexes generated together match
+    generated_at = datetime.now(timezone.utc).isoformat()
 
     # Determine which version to analyze
     if args.flexlibs_path:
         # Analyze FlexLibs stable
         try:
-            api_data = analyze_flexlibs_stable(args.flexlibs_path)
+            api_data = analyze_flexlibs_stable(args.flexlibs_path, cache_dir, args.jobs, parse_docs,
+                                               generated_at)
             output_file = args.output or "flexlibs_api.json"
 
             print(f"[INFO] Writing results to: {output_file}")
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(api_data, f, indent=2, ensure_ascii=False)
+            write_json(api_data, output_file)
 
             print_summary(api_data, "stable")
 
@@ -1297,17 +1896,17 @@ def main():
             print(f"[ERROR] {e}")
             import traceback
             traceback.print_exc()
-            sys.exit(1)
+            return 1
 
     elif args.flexlibs2_path:
         # Analyze FlexLibs 2.0
         try:
-            api_data = analyze_flexlibs2(args.flexlibs2_path)
+            api_data = analyze_flexlibs2(args.flexlibs2_path, cache_dir, args.jobs, parse_docs,
+                                         generated_at)
             output_file = args.output or "flexlibs2_api.json"
 
             print(f"[INFO] Writing results to: {output_file}")
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(api_data, f, indent=2, ensure_ascii=False)
+            write_json(api_data, output_file)
 
             print_summary(api_data, "2.0")
 
@@ -1315,7 +1914,7 @@ def main():
             print(f"[ERROR] {e}")
             import traceback
             traceback.print_exc()
-            sys.exit(1)
+            return 1
 
     else:
         # Default: analyze both if paths exist
@@ -1324,26 +1923,28 @@ def main():
 
         if Path(default_flexlibs2).exists():
             try:
-                api_data = analyze_flexlibs2(default_flexlibs2)
+                api_data = analyze_flexlibs2(default_flexlibs2, cache_dir, args.jobs, parse_docs,
+                                             generated_at)
                 output_file = args.output or "flexlibs2_api.json"
                 print(f"[INFO] Writing results to: {output_file}")
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(api_data, f, indent=2, ensure_ascii=False)
+                write_json(api_data, output_file)
                 print_summary(api_data, "2.0")
             except Exception as e:
                 print(f"[ERROR] FlexLibs 2.0: {e}")
 
         if Path(default_flexlibs).exists():
             try:
-                api_data = analyze_flexlibs_stable(default_flexlibs)
+                api_data = analyze_flexlibs_stable(default_flexlibs, cache_dir, args.jobs, parse_docs,
+                                                   generated_at)
                 output_file = "flexlibs_api.json"
                 print(f"\n[INFO] Writing results to: {output_file}")
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(api_data, f, indent=2, ensure_ascii=False)
+                write_json(api_data, output_file)
                 print_summary(api_data, "stable")
             except Exception as e:
                 print(f"[ERROR] FlexLibs stable: {e}")
 
+    return 0
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
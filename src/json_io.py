@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+JSON Reading and Writing for the API Indexes
+
+Shared by refresh.py and postprocess.py, which read and rewrite the large
+index files, and by server.py, which loads them. orjson is used when it is
+installed, with the json module as the fallback; both produce the same
+pretty-printed UTF-8 output.
+"""
+
+import json
+import mmap
+import os
+from pathlib import Path
+
+# Optional fast JSON parsing and writing for the (large) indexes
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def load_json(path: Path):
+    """Load a JSON file, using orjson when available.
+
+    orjson parses the file through a memory map, so the file's bytes are
+    not copied into a bytes object first.
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # (e.g. empty files cannot be mapped)
+                return orjson.loads(f.read())
+            with mapped, memoryview(mapped) as view:
+                return orjson.loads(view)
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_json(data, path: Path):
+    """Save data as pretty-printed UTF-8 JSON, using orjson when available.
+
+    The output is the same as json.dump(indent=2, ensure_ascii=False). It is
+    written to a temporary file that then replaces path, so an interrupted
+    write cannot leave a truncated index behind (the server memory-maps
+    these files).
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2) if ORJSON_AVAILABLE else None
+    except TypeError:
+        encoded = None  # e.g. integers beyond 64 bits; let the json module handle it
+    try:
+        if encoded is not None:
+            tmp_path.write_bytes(encoded)
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -814,7 +814,8 @@ def stamp_document(api_doc: Dict[str, Any], dll_dir: Path) -> Dict[str, Any]:
 
 # ---- Main Entry Point --------------------------------------------------------
 
-def main():
+def main(argv=None):
+    """Command-line entry point; argv defaults to sys.argv[1:]."""
     parser = argparse.ArgumentParser(
         description="Extract API documentation from FieldWorks .NET assemblies",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -852,7 +853,7 @@ Examples:
         help="Attempt to fetch descriptions from liblcm source (experimental)"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Configure logging
     if args.quiet:
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Post-process the API Indexes
+
+Runs the three post-processing steps on one in-memory copy of each index:
+- Reverse mapping (build_reverse_mapping.py), adding python_wrappers to LibLCM
+- Navigation graph (build_navigation_graph.py), adding relationships to LibLCM
+- Common patterns (extract_patterns.py), adding common_patterns to FlexLibs2
+
+Running the scripts one by one parses and rewrites the LibLCM and FlexLibs2
+indexes several times; here each index is read once and written once.
+
+Usage:
+    python src/postprocess.py
+"""
+
+import argparse
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import build_navigation_graph
+import build_reverse_mapping
+import extract_patterns
+from json_io import load_json, save_json
+
+
+def get_project_root() -> Path:
+    """Get the project root directory."""
+    return Path(__file__).parent.parent
+
+
+def run_all(liblcm: Optional[Dict], flexlibs2: Dict,
+            flexlibs: Dict = None) -> Dict[str, Dict[str, Any]]:
+    """Run all post-processing steps, updating liblcm and flexlibs2 in place.
+
+    The steps run in the same order as the separate scripts did: the
+    reverse mapping sees FlexLibs2 before patterns are added, and the
+    navigation graph sees LibLCM after python_wrappers are added.
+    Returns the reverse mapping, navigation graph and patterns by name.
+    If liblcm is None, the steps that need it are skipped and there is
+    no navigation graph.
+    """
+    results = {}
+
+    reverse_mapping = build_reverse_mapping.reverse_mapping_from_indexes(flexlibs2, flexlibs, liblcm)
+    build_reverse_mapping.print_summary(reverse_mapping)
+    results["reverse_mapping"] = reverse_mapping
+
+    if liblcm is not None:
+        build_reverse_mapping.add_python_wrappers(liblcm, reverse_mapping)
+
+        nav_graph = build_navigation_graph.navigation_graph_from_liblcm(liblcm)
+        build_navigation_graph.print_summary(nav_graph)
+        build_navigation_graph.add_relationships(liblcm, nav_graph)
+        results["navigation_graph"] = nav_graph
+
+    patterns = extract_patterns.patterns_from_flexlibs(flexlibs2)
+    extract_patterns.print_summary(patterns)
+    extract_patterns.add_patterns(flexlibs2, patterns)
+    results["common_patterns"] = patterns
+
+    return results
+
+
+def main(argv=None):
+    """Command-line entry point; argv defaults to sys.argv[1:]."""
+    parser = argparse.ArgumentParser(
+        description="Build the reverse mapping, navigation graph and common patterns"
+    )
+    parser.parse_args(argv)
+
+    root = get_project_root()
+    index = root / "index"
+    flexlibs2_path = index / "flexlibs" / "flexlibs2_api.json"
+    flexlibs_path = index / "flexlibs" / "flexlibs_api.json"
+    liblcm_path = index / "liblcm" / "flex-api-enhanced.json"
+
+    flexlibs2 = load_json(flexlibs2_path)
+    flexlibs = load_json(flexlibs_path) if flexlibs_path.exists() else None
+    if liblcm_path.exists():
+        liblcm = load_json(liblcm_path)
+    else:
+        print(f"[WARN] LibLCM index not found, skipping python_wrappers and "
+              f"the navigation graph: {liblcm_path}")
+        liblcm = None
+
+    results = run_all(liblcm, flexlibs2, flexlibs)
+
+    outputs = {index / f"{name}.json": result for name, result in results.items()}
+    if liblcm is not None:
+        outputs[liblcm_path] = liblcm
+    outputs[flexlibs2_path] = flexlibs2
+    for path, data in outputs.items():
+        save_json(data, path)
+        print(f"[INFO] Saved: {path}")
+
+    print("\n[DONE] Post-processing complete")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
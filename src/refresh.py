@@ -11,28 +11,48 @@ Usage:
     python src/refresh.py --flexlibs2-only    # Only refresh FlexLibs 2.0
     python src/refresh.py --flexlibs-only     # Only refresh FlexLibs stable
     python src/refresh.py --liblcm-only       # Only refresh LibLCM
+    python src/refresh.py --force             # Refresh even if sources are unchanged
+    python src/refresh.py --in-process        # Call the scripts' main() in this process
 """
 
 import argparse
+import hashlib
+import importlib
+import io
+import json
 import subprocess
 import sys
 import os
+import re
+import threading
+from bisect import bisect_right
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
+from json_io import load_json, save_json
+
+
+# A KEY=value line of a .env file (not a # comment); both parts are stripped
+_ENV_LINE_RE = re.compile(r'^[ \t]*([^#\s=][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$', re.MULTILINE)
+
 
 def load_env():
-    """Load environment variables from .env file."""
+    """Load environment variables from .env file.
+
+    Variables that are already set in the environment are left as they are.
+    """
     env_file = Path(__file__).parent.parent / ".env"
     if env_file.exists():
-        print(f"[INFO] Loading configuration from {env_file}")
-        with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ.setdefault(key.strip(), value.strip())
-                    print(f"       {key.strip()} = {value.strip()}")
+        settings = {}
+        for key, value in _ENV_LINE_RE.findall(env_file.read_text()):
+            settings.setdefault(key, value)  # the first setting of a key wins
+        os.environ.update({key: value for key, value in settings.items()
+                           if key not in os.environ})
+        print(f"[INFO] Loaded configuration from {env_file}: "
+              f"{', '.join(f'{key}={value}' for key, value in settings.items()) or 'no settings'}")
     else:
         print("[WARN] No .env file found. Using defaults. Copy .env.example to .env to configure paths.")
 
@@ -40,37 +60,86 @@ def load_env():
 # Load .env on import
 load_env()
 
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_INDEX_DIR = _PROJECT_ROOT / "index"
+
+# Index files written by the refresh steps
+_OUT_FLEXLIBS = _INDEX_DIR / "flexlibs" / "flexlibs_api.json"
+_OUT_FLEXLIBS2 = _INDEX_DIR / "flexlibs" / "flexlibs2_api.json"
+_OUT_LIBLCM = _INDEX_DIR / "liblcm" / "liblcm_api.json"
+
+# Per-file cache shared by the FlexLibs stable and 2.0 analyzer runs
+_ANALYZER_CACHE_DIR = _PROJECT_ROOT / ".flexlibs2_cache"
+
 
 def get_project_root() -> Path:
     """Get the project root directory."""
-    return Path(__file__).parent.parent
+    return _PROJECT_ROOT
+
+
+def _read_head(stream, limit: int, head: list):
+    """Read a stream to the end, keeping only its first limit characters in head."""
+    size = 0
+    for chunk in iter(lambda: stream.read(8192), ''):
+        if size < limit:
+            head.append(chunk[:limit - size])
+            size += len(head[-1])
+
+
+def _tail_lines(stream, count: int) -> list:
+    """Read a stream to the end and return its last count lines, ignoring trailing blank lines."""
+    tail = deque(maxlen=count)
+    blank = []  # blank lines not yet known to be followed by text
+    for line in stream:
+        line = line.rstrip('\n')
+        if not line.strip():
+            if len(blank) < count:
+                blank.append(line)
+            continue
+        tail.extend(blank)
+        blank.clear()
+        tail.append(line)
+    return list(tail)
 
 
 def run_command(cmd: list, description: str) -> bool:
-    """Run a command and return success status."""
+    """Run a command and return success status.
+
+    The output is read as it is produced and only the parts that are
+    reported are kept (the last lines of stdout and the start of stderr),
+    so memory use does not grow with the command's verbosity.
+    """
     print(f"\n[INFO] {description}...")
     print(f"       Running: {' '.join(cmd)}")
 
     try:
-        result = subprocess.run(
+        with subprocess.Popen(
             cmd,
-            cwd=get_project_root(),
-            capture_output=True,
+            cwd=_PROJECT_ROOT,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True
-        )
-
-        if result.returncode == 0:
+        ) as process:
+            # Drain stderr in a thread, so neither pipe can fill up and block
+            # the command (select() does not work on pipes on Windows)
+            stderr_head = []
+            stderr_reader = threading.Thread(target=_read_head,
+                                             args=(process.stderr, 500, stderr_head))
+            stderr_reader.start()
+            lines = _tail_lines(process.stdout, 5)
+            stderr_reader.join()
+            returncode = process.wait()
+
+        if returncode == 0:
             print(f"[OK] {description} completed successfully")
-            if result.stdout:
-                # Print last few lines of output
-                lines = result.stdout.strip().split('\n')
-                for line in lines[-5:]:
-                    print(f"     {line}")
+            # Print last few lines of output
+            for line in lines:
+                print(f"     {line}")
             return True
         else:
             print(f"[ERROR] {description} failed")
-            if result.stderr:
-                print(f"        {result.stderr[:500]}")
+            if stderr_head:
+                print(f"        {''.join(stderr_head)}")
             return False
 
     except Exception as e:
@@ -78,50 +147,202 @@ def run_command(cmd: list, description: str) -> bool:
         return False
 
 
-def refresh_flexlibs_stable(flexlibs_path: str = None) -> bool:
+# Call the index scripts' main() in this process rather than running each in
+# its own interpreter (--in-process). Off by default: the scripts then share
+# this process (and, for liblcm_extractor, its CLR), so they run one at a time.
+RUN_IN_PROCESS = False
+
+
+def run_module(module_name: str, argv: list, description: str) -> bool:
+    """Call a script module's main(argv) in this process; return success status.
+
+    Saves an interpreter start per script. The output is captured and
+    reported like run_command does.
+    """
+    print(f"\n[INFO] {description}...")
+    print(f"       Running: {module_name}.main({argv})")
+
+    with captured_output() as output:
+        try:
+            status = importlib.import_module(module_name).main(argv)
+        except SystemExit as e:
+            # (argparse exits on bad arguments)
+            status = e.code
+        except Exception as e:
+            print(f"{type(e).__name__}: {e}")
+            status = 1
+
+    lines = output.getvalue().strip().split('\n')
+    if not status:
+        print(f"[OK] {description} completed successfully")
+        if lines != ['']:
+            # Print last few lines of output
+            for line in lines[-5:]:
+                print(f"     {line}")
+        return True
+
+    print(f"[ERROR] {description} failed")
+    if lines != ['']:
+        for line in lines[-10:]:
+            print(f"        {line}")
+    return False
+
+
+def run_script(cmd: list, description: str) -> bool:
+    """Run a [sys.executable, script, *args] command, in a subprocess unless RUN_IN_PROCESS."""
+    if not RUN_IN_PROCESS:
+        return run_command(cmd, description)
+    return run_module(Path(cmd[1]).stem, cmd[2:], description)
+
+
+# Fingerprints of the sources each index was last built from, by index name
+# (see refresh_if_changed)
+REFRESH_CACHE_FILE = ".refresh-cache.json"
+
+
+def _iter_source_files(directory, suffixes: tuple, recursive: bool = True):
+    """Yield the files under a directory with one of the given suffixes.
+
+    Hidden directories (.git etc.) and __pycache__ are skipped.
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if (recursive and not entry.name.startswith('.')
+                        and entry.name != "__pycache__"):
+                    yield from _iter_source_files(entry.path, suffixes)
+            elif entry.name.endswith(suffixes):
+                yield entry
+
+
+def _source_fingerprint(root: Path, suffixes: tuple, script: str,
+                        recursive: bool = True) -> str:
+    """Fingerprint a source tree from its files' paths, sizes and mtimes.
+
+    The script that builds the index from the tree is included, so changes
+    to the extraction logic also invalidate the fingerprint. Files are not
+    read, which keeps this cheap enough to run on every refresh.
+    """
+    entries = [(os.path.relpath(entry.path, root), entry.stat())
+               for entry in _iter_source_files(root, suffixes, recursive)]
+    entries.append((script, (_PROJECT_ROOT / script).stat()))
+    entries.sort(key=lambda item: item[0])
+
+    key = hashlib.blake2b(digest_size=16)
+    for rel_path, st in entries:
+        key.update(f"{rel_path}\0{st.st_size}\0{st.st_mtime_ns}\n".encode('utf-8'))
+    return key.hexdigest()
+
+
+def load_refresh_cache() -> dict:
+    """Load the source fingerprints recorded by earlier refreshes."""
+    cache_file = _INDEX_DIR / REFRESH_CACHE_FILE
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+# Refreshes run in parallel threads (see run_parallel)
+_refresh_cache_lock = threading.Lock()
+
+
+def save_refresh_cache(name: str, fingerprint: str):
+    """Record the source fingerprint an index was built from."""
+    cache_file = _INDEX_DIR / REFRESH_CACHE_FILE
+    with _refresh_cache_lock:
+        cache = load_refresh_cache()
+        cache[name] = fingerprint
+        try:
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=2)
+        except OSError as e:
+            print(f"[WARN] Could not save refresh cache: {e}")
+
+
+def refresh_if_changed(name: str, source_root, suffixes: tuple, output_path: Path,
+                       cmd: list, description: str, force: bool = False,
+                       recursive: bool = True) -> bool:
+    """Run an index-building command unless its sources are unchanged.
+
+    The command is skipped if the fingerprint of source_root (see
+    _source_fingerprint; cmd[1] is the script) matches the one recorded
+    after the last successful run and output_path still exists. source_root
+    should be the directory the command actually reads, walked recursively
+    only if the command walks it recursively, so unrelated changes do not
+    force a rebuild. If source_root is None or cannot be read, the command
+    always runs.
+    """
+    fingerprint = None
+    if source_root is not None:
+        try:
+            fingerprint = _source_fingerprint(Path(source_root), suffixes, cmd[1], recursive)
+        except OSError as e:
+            print(f"[WARN] Could not fingerprint {source_root}: {e}")
+
+    if (not force and fingerprint is not None and output_path.exists()
+            and load_refresh_cache().get(name) == fingerprint):
+        print(f"\n[SKIP] {description}: sources unchanged")
+        return True
+
+    if not run_script(cmd, description):
+        return False
+    if fingerprint is not None:
+        save_refresh_cache(name, fingerprint)
+    return True
+
+
+def refresh_flexlibs_stable(flexlibs_path: str = None, force: bool = False) -> bool:
     """Refresh FlexLibs stable index."""
     if flexlibs_path is None:
         flexlibs_path = os.environ.get("FLEXLIBS_PATH", "D:/Github/flexlibs")
         
     print("==============", flexlibs_path)
 
-    output_path = get_project_root() / "index" / "flexlibs" / "flexlibs_api.json"
+    output_path = _OUT_FLEXLIBS
 
     cmd = [
         sys.executable,
         "src/flexlibs2_analyzer.py",
         "--flexlibs-path", flexlibs_path,
-        "--output", str(output_path)
+        "--output", str(output_path),
+        "--cache-dir", str(_ANALYZER_CACHE_DIR)
     ]
 
-    return run_command(cmd, "Refreshing FlexLibs stable index")
+    # The analyzer only reads the top level of flexlibs/code
+    return refresh_if_changed("flexlibs", Path(flexlibs_path) / "flexlibs" / "code", (".py",),
+                              output_path, cmd, "Refreshing FlexLibs stable index", force,
+                              recursive=False)
 
 
-def refresh_flexlibs2(flexlibs2_path: str = None) -> bool:
+def refresh_flexlibs2(flexlibs2_path: str = None, force: bool = False) -> bool:
     """Refresh FlexLibs 2.0 index."""
     if flexlibs2_path is None:
         flexlibs2_path = os.environ.get("FLEXLIBS2_PATH", "D:/Github/flexlibs2")
 
     print("=================" , flexlibs2_path)
 
-    output_path = get_project_root() / "index" / "flexlibs" / "flexlibs2_api.json"
+    output_path = _OUT_FLEXLIBS2
 
     cmd = [
         sys.executable,
         "src/flexlibs2_analyzer.py",
         "--flexlibs2-path", flexlibs2_path,
-        "--output", str(output_path)
+        "--output", str(output_path),
+        "--cache-dir", str(_ANALYZER_CACHE_DIR)
     ]
 
-    return run_command(cmd, "Refreshing FlexLibs 2.0 index")
+    return refresh_if_changed("flexlibs2", Path(flexlibs2_path) / "flexlibs2" / "code", (".py",),
+                              output_path, cmd, "Refreshing FlexLibs 2.0 index", force)
 
 
-def refresh_liblcm(dll_path: str = None) -> bool:
+def refresh_liblcm(dll_path: str = None, force: bool = False) -> bool:
     """Refresh LibLCM index."""
     if dll_path is None:
         dll_path = os.environ.get("FIELDWORKS_DLL_PATH")
 
-    output_path = get_project_root() / "index" / "liblcm" / "liblcm_api.json"
+    output_path = _OUT_LIBLCM
 
     cmd = [
         sys.executable,
@@ -132,7 +353,146 @@ def refresh_liblcm(dll_path: str = None) -> bool:
     if dll_path:
         cmd.extend(["--dll-path", dll_path])
 
-    return run_command(cmd, "Refreshing LibLCM index")
+    # The extractor loads assemblies from the top level of the DLL directory.
+    # Without a DLL path it finds the DLLs itself, so there is nothing to
+    # fingerprint and the index is always rebuilt.
+    return refresh_if_changed("liblcm", dll_path, (".dll",), output_path, cmd,
+                              "Refreshing LibLCM index", force, recursive=False)
+
+
+# LibLCM entity categorization rules (see categorize_entity), checked in
+# this order: namespace, name prefix, name keywords, then name patterns
+
+# Namespace prefixes and their categories
+NAMESPACE_RULES = {
+    'SIL.LCModel.Core.Text': 'texts',
+    'SIL.LCModel.Core.WritingSystems': 'writing_system',
+    'SIL.LCModel.Core.SpellChecking': 'system',
+    'SIL.LCModel.Core.Scripture': 'scripture',
+    'SIL.LCModel.Core.Phonology': 'grammar',
+    'SIL.LCModel.DomainServices.DataMigration': 'system',
+    'SIL.LCModel.DomainServices.BackupRestore': 'system',
+    'SIL.LCModel.Infrastructure.Impl': 'system',
+    'SIL.LCModel.Infrastructure': 'system',
+    'SIL.LCModel.Utils': 'system',
+    'SIL.LCModel.Tools': 'system',
+}
+
+# NAMESPACE_RULES as sorted parallel lists, for _namespace_category
+_NAMESPACE_KEYS = sorted(NAMESPACE_RULES)
+_NAMESPACE_CATEGORIES = [NAMESPACE_RULES[key] for key in _NAMESPACE_KEYS]
+
+
+def _namespace_category(ns: str):
+    """Get the category of the longest NAMESPACE_RULES prefix of ns, or None.
+
+    Uses binary search over the sorted prefixes. A prefix of ns sorts at or
+    before it, so the search starts from the last key <= ns. If that key
+    is not a prefix of ns, only keys <= the part it shares with ns can be,
+    so the search narrows to those. (The rules never give a namespace two
+    different categories, so the longest match is the one that counts.)
+    """
+    i = bisect_right(_NAMESPACE_KEYS, ns)
+    while i:
+        key = _NAMESPACE_KEYS[i - 1]
+        if ns.startswith(key):
+            return _NAMESPACE_CATEGORIES[i - 1]
+        shared = len(os.path.commonprefix((key, ns)))
+        i = bisect_right(_NAMESPACE_KEYS, ns[:shared], 0, i - 1)
+    return None
+
+
+# Name prefixes (interface and class forms) and their categories. No prefix
+# is a prefix of another, so at most one can match a name.
+NAME_PREFIX_RULES = {
+    'IMo': 'grammar', 'Mo': 'grammar',
+    'IPh': 'grammar', 'Ph': 'grammar',
+    'IFs': 'grammar', 'Fs': 'grammar',
+    'IWfi': 'wordform', 'Wfi': 'wordform',
+    'IDs': 'discourse', 'Ds': 'discourse',
+    'IRn': 'notebook', 'Rn': 'notebook',
+    'IScr': 'scripture', 'Scr': 'scripture',
+    'ISt': 'texts', 'St': 'texts',
+    'IText': 'texts', 'Text': 'texts',
+    'ILex': 'lexicon', 'Lex': 'lexicon',
+    'IReversal': 'reversal', 'Reversal': 'reversal',
+}
+
+# All the prefix rules in one regex, with a group named for each category
+# (match.lastgroup), so a name is matched in a single call
+_NAME_PREFIX_RE = re.compile('|'.join(
+    f"(?P<{category}>"
+    f"{'|'.join(re.escape(prefix) for prefix, cat in NAME_PREFIX_RULES.items() if cat == category)})"
+    for category in dict.fromkeys(NAME_PREFIX_RULES.values())))
+
+# Keywords found anywhere in the lowercased name, in priority order
+NAME_KEYWORD_RULES = (
+    (('sense', 'entry', 'lexeme', 'headword'), 'lexicon'),
+    (('paragraph', 'footnote'), 'texts'),
+    (('wordform', 'concordance'), 'wordform'),
+    (('interlin', 'baseline'), 'texts'),
+)
+
+# All the keyword rules in one regex. Each alternative is a lookahead for one
+# rule's keywords; alternatives are tried in order at the start of the name,
+# so the first rule with a keyword anywhere in the name wins (as opposed to
+# the keyword that occurs first). The matching rule is match.lastindex - 1.
+_NAME_KEYWORD_RE = re.compile('|'.join(
+    f"(?=.*?({'|'.join(map(re.escape, keywords))}))"
+    for keywords, _ in NAME_KEYWORD_RULES), re.DOTALL)
+
+
+def _name_category(name: str):
+    """Get the category the name rules give an entity name, or None."""
+    # Prefix patterns
+    match = _NAME_PREFIX_RE.match(name)
+    if match:
+        return match.lastgroup
+
+    # Semantic name patterns
+    match = _NAME_KEYWORD_RE.match(name.lower())
+    if match:
+        return NAME_KEYWORD_RULES[match.lastindex - 1][1]
+
+    # Compiler-generated
+    if '<>c__' in name or name.startswith('Class_'):
+        return 'internal'
+
+    # Factory/Repository patterns
+    if 'Factory' in name:
+        return 'factory'
+    if 'Repository' in name:
+        return 'repository'
+
+    return None
+
+
+def categorize_entity(name: str, entity: dict) -> str:
+    """Get the semantic category for a LibLCM entity.
+
+    Namespace rules come first, then name rules. Falls back to the entity's
+    current category (default 'general') if no rule matches.
+    """
+    return (_namespace_category(entity.get('namespace', ''))
+            or _name_category(name)
+            or entity.get('category', 'general'))
+
+
+def categorize_entities(entities: dict) -> dict:
+    """Get the categorize_entity() category of every entity, by name.
+
+    Works column-wise: the namespace rules are applied once per distinct
+    namespace (there are far fewer namespaces than entities), and only the
+    entities they leave uncategorized go through the name rules.
+    """
+    namespaces = [entity.get('namespace', '') for entity in entities.values()]
+    ns_categories = {ns: _namespace_category(ns) for ns in set(namespaces)}
+
+    return {
+        name: (ns_categories[ns] or _name_category(name)
+               or entity.get('category', 'general'))
+        for (name, entity), ns in zip(entities.items(), namespaces)
+    }
 
 
 def apply_categorization() -> bool:
@@ -140,105 +500,31 @@ def apply_categorization() -> bool:
     print("\n[INFO] Applying semantic categorization to LibLCM...")
 
     try:
-        import json
         from collections import Counter
 
-        liblcm_path = get_project_root() / "index" / "liblcm" / "liblcm_api.json"
-
-        with open(liblcm_path, 'r', encoding='utf-8') as f:
-            lcm = json.load(f)
-
-        # Namespace-based categorization rules
-        namespace_rules = {
-            'SIL.LCModel.Core.Text': 'texts',
-            'SIL.LCModel.Core.WritingSystems': 'writing_system',
-            'SIL.LCModel.Core.SpellChecking': 'system',
-            'SIL.LCModel.Core.Scripture': 'scripture',
-            'SIL.LCModel.Core.Phonology': 'grammar',
-            'SIL.LCModel.DomainServices.DataMigration': 'system',
-            'SIL.LCModel.DomainServices.BackupRestore': 'system',
-            'SIL.LCModel.Infrastructure.Impl': 'system',
-            'SIL.LCModel.Infrastructure': 'system',
-            'SIL.LCModel.Utils': 'system',
-            'SIL.LCModel.Tools': 'system',
-        }
-
-        def categorize_entity(name, entity):
-            current = entity.get('category', 'general')
-            ns = entity.get('namespace', '')
-
-            # Apply namespace rules
-            for ns_pattern, cat in namespace_rules.items():
-                if ns.startswith(ns_pattern):
-                    return cat
-
-            # Name-based rules
-            name_lower = name.lower()
-
-            # Prefix patterns
-            if name.startswith('IMo') or name.startswith('Mo'):
-                return 'grammar'
-            if name.startswith('IPh') or name.startswith('Ph'):
-                return 'grammar'
-            if name.startswith('IFs') or name.startswith('Fs'):
-                return 'grammar'
-            if name.startswith('IWfi') or name.startswith('Wfi'):
-                return 'wordform'
-            if name.startswith('IDs') or name.startswith('Ds'):
-                return 'discourse'
-            if name.startswith('IRn') or name.startswith('Rn'):
-                return 'notebook'
-            if name.startswith('IScr') or name.startswith('Scr'):
-                return 'scripture'
-            if name.startswith('ISt') or name.startswith('St'):
-                return 'texts'
-            if name.startswith('IText') or name.startswith('Text'):
-                return 'texts'
-            if name.startswith('ILex') or name.startswith('Lex'):
-                return 'lexicon'
-            if name.startswith('IReversal') or name.startswith('Reversal'):
-                return 'reversal'
-
-            # Semantic name patterns
-            if any(x in name_lower for x in ['sense', 'entry', 'lexeme', 'headword']):
-                return 'lexicon'
-            if any(x in name_lower for x in ['paragraph', 'footnote']):
-                return 'texts'
-            if any(x in name_lower for x in ['wordform', 'concordance']):
-                return 'wordform'
-            if any(x in name_lower for x in ['interlin', 'baseline']):
-                return 'texts'
-
-            # Compiler-generated
-            if '<>c__' in name or name.startswith('Class_'):
-                return 'internal'
-
-            # Factory/Repository patterns
-            if 'Factory' in name:
-                return 'factory'
-            if 'Repository' in name:
-                return 'repository'
-
-            return current
-
-        # Apply recategorization
+        liblcm_path = _OUT_LIBLCM
+
+        lcm = load_json(liblcm_path)
+
+        # Apply recategorization, counting the resulting categories as we go
         changes = 0
-        for name, entity in lcm.get('entities', {}).items():
+        categories = Counter()
+        entities = lcm.get('entities', {})
+        new_categories = categorize_entities(entities)
+        for name, entity in entities.items():
             old_cat = entity.get('category', 'general')
-            new_cat = categorize_entity(name, entity)
+            new_cat = new_categories[name]
             if new_cat != old_cat:
                 entity['category'] = new_cat
                 changes += 1
-
-        # Save updated file
-        with open(liblcm_path, 'w', encoding='utf-8') as f:
-            json.dump(lcm, f, indent=2, ensure_ascii=False)
-
-        # Count categories
-        categories = Counter()
-        for entity in lcm.get('entities', {}).values():
             categories[entity.get('category', 'NONE')] += 1
 
+        # Save updated file. The rules are idempotent, so an index that was
+        # already categorized (e.g. when the LibLCM refresh was skipped as
+        # unchanged) comes back with no changes and is left as it is.
+        if changes:
+            save_json(lcm, liblcm_path)
+
         print(f"[OK] Recategorized {changes} entities")
         print("     Category counts:")
         for cat, count in categories.most_common(10):
@@ -251,34 +537,160 @@ def apply_categorization() -> bool:
         return False
 
 
-def run_postprocess_reverse_mapping() -> bool:
-    """Build reverse mapping from LibLCM to FlexLibs."""
-    cmd = [
-        sys.executable,
-        "src/build_reverse_mapping.py",
-        "--update-liblcm"
-    ]
-    return run_command(cmd, "Building reverse mapping (LibLCM -> FlexLibs)")
+def refresh_liblcm_and_categorize(dll_path: str = None, force: bool = False,
+                                  categorize: bool = True) -> bool:
+    """Refresh the LibLCM index, then apply semantic categorization to it."""
+    if not refresh_liblcm(dll_path, force):
+        return False
+    return apply_categorization() if categorize else True
 
 
-def run_postprocess_navigation_graph() -> bool:
-    """Build navigation graph from LibLCM relationships."""
-    cmd = [
-        sys.executable,
-        "src/build_navigation_graph.py",
-        "--update-liblcm"
-    ]
-    return run_command(cmd, "Building navigation graph")
+# Each worker thread's output goes to its own buffer (see _TaskStdout)
+_task_output = threading.local()
+
 
+class _TaskStdout:
+    """Stand-in for sys.stdout that captures the output of run_parallel tasks.
+
+    Text printed from a task's thread goes to that task's buffer, so the
+    logs of tasks running side by side do not interleave. Other threads
+    write straight through.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, text):
+        buffer = getattr(_task_output, "buffer", None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+@contextmanager
+def captured_output():
+    """Capture what this thread prints in a StringIO, which is yielded.
+
+    Works inside run_parallel tasks (and nests), since only the calling
+    thread's output is redirected.
+    """
+    stdout = sys.stdout
+    install = not isinstance(stdout, _TaskStdout)
+    if install:
+        sys.stdout = _TaskStdout(stdout)
+    previous = getattr(_task_output, "buffer", None)
+    _task_output.buffer = buffer = io.StringIO()
+    try:
+        yield buffer
+    finally:
+        _task_output.buffer = previous
+        if install:
+            sys.stdout = stdout
+
+
+def _run_task(func, args) -> tuple:
+    """Run func(*args) with its output captured; return (result, output)."""
+    with captured_output() as output:
+        result = func(*args)
+    return result, output.getvalue()
+
+
+def run_parallel(tasks: list) -> bool:
+    """Run (func, args) tasks concurrently; return True if all succeeded.
+
+    Each refresh step runs its script in a subprocess and waits on it, so
+    threads are enough to overlap them. Each task's output is printed in one
+    block when it finishes.
+
+    With --in-process the scripts run in this process instead, on one GIL
+    and (for liblcm_extractor) alongside the CLR, so the tasks are run one
+    after another.
+    """
+    if len(tasks) == 1 or RUN_IN_PROCESS:
+        success = True
+        for func, args in tasks:
+            success = func(*args) and success
+        return success
+
+    stdout = sys.stdout
+    sys.stdout = _TaskStdout(stdout)
+    success = True
+    try:
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = [executor.submit(_run_task, func, args) for func, args in tasks]
+            for future in as_completed(futures):
+                ok, output = future.result()
+                stdout.write(output)
+                stdout.flush()
+                success = success and ok
+    finally:
+        sys.stdout = stdout
+    return success
+
+
+# What post-processing reads (it also updates the two indexes), and the
+# files it writes
+_POSTPROCESS_INPUTS = (
+    _OUT_FLEXLIBS2,
+    _OUT_FLEXLIBS,
+    _INDEX_DIR / "liblcm" / "flex-api-enhanced.json",
+    _PROJECT_ROOT / "src" / "postprocess.py",
+    _PROJECT_ROOT / "src" / "build_reverse_mapping.py",
+    _PROJECT_ROOT / "src" / "build_navigation_graph.py",
+    _PROJECT_ROOT / "src" / "extract_patterns.py",
+)
+_POSTPROCESS_OUTPUTS = (
+    _INDEX_DIR / "reverse_mapping.json",
+    _INDEX_DIR / "navigation_graph.json",
+    _INDEX_DIR / "common_patterns.json",
+)
+
+
+def _files_digest(paths) -> str:
+    """Hash the contents of files (read in chunks); missing files hash as missing."""
+    key = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        key.update(f"{path.name}\0".encode('utf-8'))
+        try:
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    key.update(chunk)
+        except FileNotFoundError:
+            key.update(b'\0missing')
+        key.update(b'\0')
+    return key.hexdigest()
+
+
+def run_postprocess(force: bool = False) -> bool:
+    """Build the reverse mapping, navigation graph and common patterns.
+
+    postprocess.py runs all three steps on one copy of each index, so the
+    LibLCM and FlexLibs2 indexes are each parsed and written only once.
+
+    The step is skipped if its inputs are byte-for-byte what the last run
+    left behind (i.e. every index refresh was skipped) and its outputs
+    exist. Analyzer runs stamp a new _generated_at, so any rebuilt index
+    counts as changed.
+    """
+    description = "Post-processing (reverse mapping, navigation graph, patterns)"
+    if (not force and all(path.exists() for path in _POSTPROCESS_OUTPUTS)
+            and load_refresh_cache().get("postprocess") == _files_digest(_POSTPROCESS_INPUTS)):
+        print(f"\n[SKIP] {description}: indexes unchanged")
+        return True
 
-def run_postprocess_patterns() -> bool:
-    """Extract common patterns from FlexLibs docstrings."""
     cmd = [
         sys.executable,
-        "src/extract_patterns.py",
-        "--update-flexlibs"
+        "src/postprocess.py"
     ]
-    return run_command(cmd, "Extracting common patterns")
+    if not run_script(cmd, description):
+        return False
+    # (postprocess.py updates its input indexes, so hash them afterwards)
+    save_refresh_cache("postprocess", _files_digest(_POSTPROCESS_INPUTS))
+    return True
 
 
 def main():
@@ -324,9 +736,23 @@ def main():
         action="store_true",
         help="Skip post-processing (reverse mapping, navigation graph, patterns)"
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild indexes even if their sources are unchanged since the last refresh"
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Call each index script's main() in this process instead of a separate "
+             "Python process (the refreshes then run one at a time)"
+    )
 
     args = parser.parse_args()
 
+    global RUN_IN_PROCESS
+    RUN_IN_PROCESS = args.in_process
+
     print("=" * 60)
     print("FlexTools MCP Index Refresh")
     print(f"Started: {datetime.now().isoformat()}")
@@ -337,23 +763,19 @@ def main():
     # Determine what to refresh
     only_one = args.flexlibs2_only or args.flexlibs_only or args.liblcm_only
 
-    # Refresh FlexLibs stable
+    # The three indexes are built from separate sources into separate
+    # files, so they are refreshed concurrently
+    refresh_tasks = []
     if args.flexlibs_only or (not only_one):
-        if not refresh_flexlibs_stable(args.flexlibs_path):
-            success = False
-
-    # Refresh FlexLibs 2.0
+        refresh_tasks.append((refresh_flexlibs_stable, (args.flexlibs_path, args.force)))
     if args.flexlibs2_only or (not only_one):
-        if not refresh_flexlibs2(args.flexlibs2_path):
-            success = False
-
-    # Refresh LibLCM
+        refresh_tasks.append((refresh_flexlibs2, (args.flexlibs2_path, args.force)))
     if args.liblcm_only or (not only_one):
-        if not refresh_liblcm(args.dll_path):
-            success = False
-        elif not args.skip_categorization:
-            if not apply_categorization():
-                success = False
+        refresh_tasks.append((refresh_liblcm_and_categorize,
+                              (args.dll_path, args.force, not args.skip_categorization)))
+
+    if not run_parallel(refresh_tasks):
+        success = False
 
     # Post-processing steps (run if any indexes were refreshed)
     if not args.skip_postprocess and not only_one:
@@ -361,16 +783,7 @@ def main():
         print("Post-processing...")
         print("-" * 40)
 
-        # Build reverse mapping
-        if not run_postprocess_reverse_mapping():
-            success = False
-
-        # Build navigation graph
-        if not run_postprocess_navigation_graph():
-            success = False
-
-        # Extract patterns
-        if not run_postprocess_patterns():
+        if not run_postprocess(args.force):
             success = False
 
     print("\n" + "=" * 60)
@@ -9,13 +9,20 @@ of the LibLCM and FlexLibs APIs for generating FlexTools scripts.
 
 import json
 import asyncio
+import heapq
 import sys
 import subprocess
 import tempfile
 import os
+import re
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
 from pathlib import Path
 from typing import Any, Optional, List, Dict
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -25,6 +32,19 @@ from mcp.types import (
     CallToolResult,
 )
 
+try:
+    from json_io import load_json
+except ImportError:
+    # Imported as src.server (from the project root) rather than run as a script
+    from src.json_io import load_json
+
+# Optional fast JSON serialization of tool responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Optional imports for semantic search
 try:
     import numpy as np
@@ -35,6 +55,21 @@ except ImportError:
     SEMANTIC_SEARCH_AVAILABLE = False
 
 
+def dumps_json(obj, default=None) -> str:
+    """Serialize obj as JSON indented by two spaces, using orjson when available.
+
+    Non-ASCII characters are written as they are rather than escaped.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                obj, default=default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; let the json module handle it
+    return json.dumps(obj, indent=2, default=default, ensure_ascii=False)
+
+
 @dataclass
 class SemanticSearch:
     """Handles semantic search using sentence-transformers and FAISS."""
@@ -61,8 +96,7 @@ class SemanticSearch:
 
         try:
             # Load metadata
-            with open(metadata_path, "r", encoding="utf-8") as f:
-                metadata = json.load(f)
+            metadata = load_json(metadata_path)
             search.items = metadata.get("items", [])
 
             # Load FAISS index
@@ -119,6 +153,200 @@ class SemanticSearch:
         return results
 
 
+def intern_names(index_data: dict):
+    """Intern entity categories and method names in place.
+
+    JSON parsing gives every occurrence its own string; the same few
+    categories and method names repeat across thousands of entities.
+    """
+    if not index_data:
+        return
+    for entity in index_data.get("entities", {}).values():
+        if isinstance(entity.get("category"), str):
+            entity["category"] = sys.intern(entity["category"])
+        for method in entity.get("methods", []):
+            if isinstance(method.get("name"), str):
+                method["name"] = sys.intern(method["name"])
+
+
+def lower_entity_keys(index_data: dict) -> List[tuple]:
+    """Lowercased lookup keys for each entity, in index order.
+
+    Each item is (name, category, method names) lowercased, followed by the
+    entity name and the entity itself.
+    """
+    if not index_data:
+        return []
+    return [
+        (
+            name.lower(),
+            sys.intern(entity.get("category", "").lower()),
+            [method.get("name", "").lower() for method in entity.get("methods", [])],
+            name,
+            entity,
+        )
+        for name, entity in index_data.get("entities", {}).items()
+    ]
+
+
+def names_by_lower(lowered: List[tuple]) -> Dict[str, str]:
+    """Map lowercased entity name -> entity name (the first, if names differ only by case)."""
+    by_lower = {}
+    for name_lower, _, _, name, _ in lowered:
+        by_lower.setdefault(name_lower, name)
+    return by_lower
+
+
+def group_by_category(lowered_entities: Dict[str, List[tuple]]) -> Dict[str, Dict[str, List[tuple]]]:
+    """Map lowercased category -> source -> [(entity name, entity)], in index order."""
+    by_category = {}
+    for source, lowered in lowered_entities.items():
+        for _, category_lower, _, name, entity in lowered:
+            by_category.setdefault(category_lower, {}).setdefault(source, []).append((name, entity))
+    return by_category
+
+
+def count_categories(flexlibs2: dict, liblcm: dict) -> Dict[str, Dict[str, int]]:
+    """Count the FlexLibs 2.0 and LibLCM entities of each category."""
+    categories = {}
+
+    # From FlexLibs 2.0
+    if flexlibs2:
+        fl2_cats = flexlibs2.get("categories", {})
+        for cat_name, cat_data in fl2_cats.items():
+            if cat_name not in categories:
+                categories[cat_name] = {"flexlibs2_count": 0, "liblcm_count": 0}
+            categories[cat_name]["flexlibs2_count"] = len(cat_data.get("entities", []))
+
+    # From LibLCM
+    if liblcm:
+        for entity in liblcm.get("entities", {}).values():
+            cat = entity.get("category", "uncategorized")
+            if cat not in categories:
+                categories[cat] = {"flexlibs2_count": 0, "liblcm_count": 0}
+            categories[cat]["liblcm_count"] += 1
+
+    return categories
+
+
+@dataclass
+class SubstringIndex:
+    """Finds the names that contain a string with one search over all of them.
+
+    The names are joined with newlines, so str.find scans them all in C;
+    a hit is mapped back to its name by bisecting the names' offsets.
+    """
+    joined: str = ""
+    starts: List[int] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, names: List[str]) -> "SubstringIndex":
+        """Index names (already lowercased if matching is case-insensitive)."""
+        starts = []
+        offset = 0
+        for name in names:
+            starts.append(offset)
+            offset += len(name) + 1
+        return cls(joined="\n".join(names), starts=starts)
+
+    def matches(self, needle: str):
+        """Yield the positions of the names containing needle, in order."""
+        if not self.starts:
+            return
+        if "\n" in needle:
+            # Could only match across names; check each name on its own
+            for i, start in enumerate(self.starts):
+                end = self.starts[i + 1] - 1 if i + 1 < len(self.starts) else len(self.joined)
+                if needle in self.joined[start:end]:
+                    yield i
+            return
+        pos = self.joined.find(needle)
+        while pos != -1:
+            i = bisect_right(self.starts, pos) - 1
+            yield i
+            if i + 1 == len(self.starts):
+                return
+            pos = self.joined.find(needle, self.starts[i + 1])
+
+
+@dataclass
+class MethodSearchIndex:
+    """Inverted index over the methods of one API index for keyword search.
+
+    Maps each whitespace-separated token of a method's "name description
+    summary" text (and, separately, of its name) to the ids of the methods
+    containing it. Query terms never contain whitespace, so a term occurs
+    in a method's text exactly when it occurs in one of its tokens; a query
+    only scans the token vocabulary instead of every method.
+    """
+    methods: List[tuple] = field(default_factory=list)  # (entity_name, entity, method)
+    text_postings: Dict[str, List[int]] = field(default_factory=dict)
+    name_postings: Dict[str, List[int]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, index_data: dict) -> "MethodSearchIndex":
+        """Build the index from a loaded API index (may be None)."""
+        search_index = cls()
+        if not index_data:
+            return search_index
+
+        text_postings = defaultdict(list)
+        name_postings = defaultdict(list)
+        for entity_name, entity in index_data.get("entities", {}).items():
+            for method in entity.get("methods", []):
+                method_id = len(search_index.methods)
+                search_index.methods.append((entity_name, entity, method))
+                text = "{} {} {}".format(
+                    method.get('name', ''),
+                    method.get('description', ''),
+                    method.get('summary', '')
+                ).lower()
+                for token in set(text.split()):
+                    text_postings[token].append(method_id)
+                for token in set(method.get('name', '').lower().split()):
+                    name_postings[token].append(method_id)
+
+        search_index.text_postings = dict(text_postings)
+        search_index.name_postings = dict(name_postings)
+        return search_index
+
+    @staticmethod
+    def _matching_ids(postings: Dict[str, List[int]], term: str) -> set:
+        """Ids of the methods with a token containing term."""
+        ids = set()
+        for token, token_ids in postings.items():
+            if term in token:
+                ids.update(token_ids)
+        return ids
+
+    def score(self, terms) -> Dict[int, int]:
+        """Score methods against the query terms; method id -> score.
+
+        Each term scores 1 if it occurs in the method's text and 2 more if
+        it occurs in the method's name; methods without a match are omitted.
+        """
+        scores = defaultdict(int)
+        for term in terms:
+            for method_id in self._matching_ids(self.text_postings, term):
+                scores[method_id] += 1
+            for method_id in self._matching_ids(self.name_postings, term):
+                scores[method_id] += 2
+        return scores
+
+    def result(self, method_id: int, score: int, source_name: str) -> Dict:
+        """The search result entry for a scored method."""
+        entity_name, entity, method = self.methods[method_id]
+        return {
+            "score": score,
+            "source": source_name,
+            "entity": entity_name,
+            "name": method.get("name"),
+            "type": "method",
+            "signature": method.get("signature"),
+            "description": method.get("summary", method.get("description", ""))[:150],
+            "category": entity.get("category", "general"),
+        }
+
 @dataclass
 class APIIndex:
     """Holds the loaded API documentation indexes."""
@@ -127,6 +355,12 @@ class APIIndex:
     flexlibs_stable: dict = None
     navigation_graph: dict = None
     semantic_search: SemanticSearch = None
+    method_indexes: Dict[str, MethodSearchIndex] = field(default_factory=dict)
+    lowered_entities: Dict[str, List[tuple]] = field(default_factory=dict)
+    entity_name_index: Dict[str, SubstringIndex] = field(default_factory=dict)
+    entity_names_by_lower: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    entities_by_category: Dict[str, Dict[str, List[tuple]]] = field(default_factory=dict)
+    category_counts: Dict[str, Dict[str, int]] = field(default_factory=dict)
 
     @classmethod
     def load(cls, index_dir: Path) -> "APIIndex":
@@ -136,26 +370,51 @@ class APIIndex:
         # Load LibLCM
         liblcm_path = index_dir / "liblcm" / "flex-api-enhanced.json"
         if liblcm_path.exists():
-            with open(liblcm_path, "r", encoding="utf-8") as f:
-                index.liblcm = json.load(f)
+            index.liblcm = load_json(liblcm_path)
 
         # Load FlexLibs 2.0
         flexlibs2_path = index_dir / "flexlibs" / "flexlibs2_api.json"
         if flexlibs2_path.exists():
-            with open(flexlibs2_path, "r", encoding="utf-8") as f:
-                index.flexlibs2 = json.load(f)
+            index.flexlibs2 = load_json(flexlibs2_path)
 
         # Load FlexLibs Stable
         flexlibs_stable_path = index_dir / "flexlibs" / "flexlibs_api.json"
         if flexlibs_stable_path.exists():
-            with open(flexlibs_stable_path, "r", encoding="utf-8") as f:
-                index.flexlibs_stable = json.load(f)
+            index.flexlibs_stable = load_json(flexlibs_stable_path)
 
         # Load navigation graph
         nav_graph_path = index_dir / "navigation_graph.json"
         if nav_graph_path.exists():
-            with open(nav_graph_path, "r", encoding="utf-8") as f:
-                index.navigation_graph = json.load(f)
+            index.navigation_graph = load_json(nav_graph_path)
+
+        # Share one string per distinct category and method name
+        for index_data in (index.liblcm, index.flexlibs2, index.flexlibs_stable):
+            intern_names(index_data)
+
+        # Lowercase entity, category and method names once, for case-insensitive lookups
+        index.lowered_entities = {
+            "flexlibs2": lower_entity_keys(index.flexlibs2),
+            "liblcm": lower_entity_keys(index.liblcm),
+        }
+        index.entity_name_index = {
+            source: SubstringIndex.build([keys[0] for keys in lowered])
+            for source, lowered in index.lowered_entities.items()
+        }
+        index.entity_names_by_lower = {
+            source: names_by_lower(lowered)
+            for source, lowered in index.lowered_entities.items()
+        }
+
+        # Group entities by category once, for the category listings
+        index.entities_by_category = group_by_category(index.lowered_entities)
+        index.category_counts = count_categories(index.flexlibs2, index.liblcm)
+
+        # Build keyword search indexes over the methods of each source
+        index.method_indexes = {
+            "flexlibs2": MethodSearchIndex.build(index.flexlibs2),
+            "flexlibs_stable": MethodSearchIndex.build(index.flexlibs_stable),
+            "liblcm": MethodSearchIndex.build(index.liblcm),
+        }
 
         # Load semantic search (optional)
         index.semantic_search = SemanticSearch.load(index_dir)
@@ -168,6 +427,7 @@ server = Server("flextools-mcp")
 
 # Global index (loaded on startup)
 api_index: Optional[APIIndex] = None
+_api_index_loading: Optional[asyncio.Future] = None
 
 
 def get_index_dir() -> Path:
@@ -175,6 +435,45 @@ def get_index_dir() -> Path:
     return Path(__file__).parent.parent / "index"
 
 
+def log_index_summary(index: APIIndex):
+    """Report which indexes were loaded on stderr (stdout carries the protocol)."""
+    if index.liblcm:
+        print(f"[OK] LibLCM: {len(index.liblcm.get('entities', {}))} entities", file=sys.stderr)
+    else:
+        print("[WARN] LibLCM index not found", file=sys.stderr)
+
+    if index.flexlibs2:
+        print(f"[OK] FlexLibs 2.0: {len(index.flexlibs2.get('entities', {}))} entities", file=sys.stderr)
+    else:
+        print("[WARN] FlexLibs 2.0 index not found", file=sys.stderr)
+
+    if index.flexlibs_stable:
+        print(f"[OK] FlexLibs Stable: {len(index.flexlibs_stable.get('entities', {}))} entities", file=sys.stderr)
+    else:
+        print("[WARN] FlexLibs Stable index not found", file=sys.stderr)
+
+
+async def get_api_index() -> APIIndex:
+    """Return the API index, loading it in a worker thread on first use.
+
+    Concurrent callers wait for the same load, so the indexes are only
+    read once and the event loop keeps serving requests meanwhile.
+    """
+    global api_index, _api_index_loading
+
+    if api_index is None:
+        if _api_index_loading is None:
+            _api_index_loading = asyncio.ensure_future(
+                asyncio.to_thread(APIIndex.load, get_index_dir())
+            )
+        try:
+            api_index = await _api_index_loading
+        except Exception:
+            _api_index_loading = None  # let the next call try again
+            raise
+    return api_index
+
+
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """List available tools."""
@@ -448,14 +747,56 @@ Defaults to DRY_RUN mode. Always backup before write_enabled=True.""",
     ]
 
 
+# Read-only tools: their responses depend only on the arguments and the
+# indexes, which do not change once loaded, so repeated calls are cached
+CACHEABLE_TOOLS = frozenset({
+    "get_object_api",
+    "search_by_capability",
+    "get_navigation_path",
+    "find_examples",
+    "list_categories",
+    "list_entities_in_category",
+})
+TOOL_CACHE_SIZE = 256
+
+# (tool name, arguments) -> response texts, least recently used first
+_tool_result_cache: "OrderedDict[tuple, List[str]]" = OrderedDict()
+
+
+def tool_cache_key(name: str, arguments: dict) -> Optional[tuple]:
+    """The cache key for a tool call, or None if its result is not cached."""
+    if name not in CACHEABLE_TOOLS:
+        return None
+    try:
+        return (name, frozenset((arguments or {}).items()))
+    except TypeError:
+        return None  # unhashable argument values (e.g. lists)
+
+
 @server.call_tool()
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool calls."""
-    global api_index
-
     if api_index is None:
-        api_index = APIIndex.load(get_index_dir())
+        await get_api_index()  # still loading (or not started, outside main())
 
+    key = tool_cache_key(name, arguments)
+    if key is not None:
+        texts = _tool_result_cache.get(key)
+        if texts is not None:
+            _tool_result_cache.move_to_end(key)
+            return [TextContent(type="text", text=text) for text in texts]
+
+    contents = await dispatch_tool(name, arguments)
+
+    if key is not None:
+        _tool_result_cache[key] = [content.text for content in contents]
+        if len(_tool_result_cache) > TOOL_CACHE_SIZE:
+            _tool_result_cache.popitem(last=False)
+    return contents
+
+
+async def dispatch_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+    """Run the handler for a tool call."""
     if name == "get_object_api":
         return await handle_get_object_api(arguments)
     elif name == "search_by_capability":
@@ -518,6 +859,10 @@ def paginate_entity(entity: dict, summary_only: bool, method_filter: str, limit:
     return result
 
 
+# Most partial name matches get_object_api lists per source
+MAX_PARTIAL_MATCHES = 10
+
+
 async def handle_get_object_api(args: dict) -> list[TextContent]:
     """Get API documentation for a specific object type."""
     object_type = args["object_type"]
@@ -528,57 +873,98 @@ async def handle_get_object_api(args: dict) -> list[TextContent]:
     limit = args.get("limit", 50)
     offset = args.get("offset", 0)
 
+    object_type_lower = object_type.lower()
+
     result = {"object_type": object_type, "found": False}
 
     # Search in FlexLibs 2.0
     if include_flexlibs2 and api_index.flexlibs2:
         entities = api_index.flexlibs2.get("entities", {})
-        # Try exact match first
-        if object_type in entities:
+        # Try exact match first, then the same name in any case
+        exact_name = object_type
+        if exact_name not in entities:
+            exact_name = api_index.entity_names_by_lower["flexlibs2"].get(object_type_lower)
+        if exact_name is not None:
             result["flexlibs2"] = paginate_entity(
-                entities[object_type], summary_only, method_filter, limit, offset
+                entities[exact_name], summary_only, method_filter, limit, offset
             )
             result["found"] = True
         else:
             # Try partial match (e.g., "LexEntry" matches "LexEntryOperations")
-            for name, entity in entities.items():
-                if object_type.lower() in name.lower():
-                    if "flexlibs2_matches" not in result:
-                        result["flexlibs2_matches"] = []
-                    result["flexlibs2_matches"].append({
-                        "name": name,
-                        "category": entity.get("category"),
-                        "methods_count": len(entity.get("methods", []))
-                    })
-                    result["found"] = True
+            lowered = api_index.lowered_entities["flexlibs2"]
+            name_index = api_index.entity_name_index["flexlibs2"]
+            matches = []
+            for i in islice(name_index.matches(object_type_lower), MAX_PARTIAL_MATCHES):
+                _, _, _, name, entity = lowered[i]
+                matches.append({
+                    "name": name,
+                    "category": entity.get("category"),
+                    "methods_count": len(entity.get("methods", []))
+                })
+            if matches:
+                result["flexlibs2_matches"] = matches
+                result["found"] = True
 
     # Search in LibLCM
     if include_liblcm and api_index.liblcm:
         entities = api_index.liblcm.get("entities", {})
-        if object_type in entities:
+        # Try exact match first, then the same name in any case
+        exact_name = object_type
+        if exact_name not in entities:
+            exact_name = api_index.entity_names_by_lower["liblcm"].get(object_type_lower)
+        if exact_name is not None:
             result["liblcm"] = paginate_entity(
-                entities[object_type], summary_only, method_filter, limit, offset
+                entities[exact_name], summary_only, method_filter, limit, offset
             )
             result["found"] = True
         else:
             # Try partial match
-            for name, entity in entities.items():
-                if object_type.lower() in name.lower():
-                    if "liblcm_matches" not in result:
-                        result["liblcm_matches"] = []
-                    result["liblcm_matches"].append({
-                        "name": name,
-                        "type": entity.get("type"),
-                        "category": entity.get("category")
-                    })
-                    if len(result.get("liblcm_matches", [])) >= 10:
-                        break
-                    result["found"] = True
+            lowered = api_index.lowered_entities["liblcm"]
+            name_index = api_index.entity_name_index["liblcm"]
+            matches = []
+            for i in islice(name_index.matches(object_type_lower), MAX_PARTIAL_MATCHES):
+                _, _, _, name, entity = lowered[i]
+                matches.append({
+                    "name": name,
+                    "type": entity.get("type"),
+                    "category": entity.get("category")
+                })
+            if matches:
+                result["liblcm_matches"] = matches
+                result["found"] = True
 
     if not result["found"]:
         result["message"] = f"No API documentation found for '{object_type}'. Try searching with search_by_capability or list_categories to explore available APIs."
 
-    return [TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
+    return [TextContent(type="text", text=dumps_json(result, default=str))]
+
+
+# Synonym expansion for common operations
+_SYNONYMS = {
+    "add": frozenset(["add", "set", "create", "insert", "append"]),
+    "set": frozenset(["set", "add", "update", "modify", "assign"]),
+    "get": frozenset(["get", "fetch", "retrieve", "find", "read"]),
+    "delete": frozenset(["delete", "remove", "clear", "erase"]),
+    "remove": frozenset(["remove", "delete", "clear"]),
+    "create": frozenset(["create", "add", "new", "make"]),
+    "update": frozenset(["update", "set", "modify", "change"]),
+    "find": frozenset(["find", "search", "get", "lookup", "query"]),
+    "list": frozenset(["list", "getall", "all", "iterate", "enumerate"]),
+    "gloss": frozenset(["gloss", "translation", "meaning"]),
+    "definition": frozenset(["definition", "meaning", "description"]),
+    "sense": frozenset(["sense", "meaning", "definition"]),
+    "entry": frozenset(["entry", "headword", "lexeme", "word"]),
+}
+
+
+@lru_cache(maxsize=512)
+def expand_query_terms(query_terms: tuple) -> frozenset:
+    """The query terms together with the synonyms of each."""
+    expanded_terms = set(query_terms)
+    for term in query_terms:
+        if term in _SYNONYMS:
+            expanded_terms.update(_SYNONYMS[term])
+    return frozenset(expanded_terms)
 
 
 async def handle_search_by_capability(args: dict) -> list[TextContent]:
@@ -634,91 +1020,52 @@ async def handle_search_by_capability(args: dict) -> list[TextContent]:
     if not results:
         query_lower = query.lower()
 
-        # Synonym expansion for common operations
-        synonyms = {
-            "add": ["add", "set", "create", "insert", "append"],
-            "set": ["set", "add", "update", "modify", "assign"],
-            "get": ["get", "fetch", "retrieve", "find", "read"],
-            "delete": ["delete", "remove", "clear", "erase"],
-            "remove": ["remove", "delete", "clear"],
-            "create": ["create", "add", "new", "make"],
-            "update": ["update", "set", "modify", "change"],
-            "find": ["find", "search", "get", "lookup", "query"],
-            "list": ["list", "getall", "all", "iterate", "enumerate"],
-            "gloss": ["gloss", "translation", "meaning"],
-            "definition": ["definition", "meaning", "description"],
-            "sense": ["sense", "meaning", "definition"],
-            "entry": ["entry", "headword", "lexeme", "word"],
-        }
-
         # Expand query terms with synonyms
-        query_terms = query_lower.split()
-        expanded_terms = set(query_terms)
-        for term in query_terms:
-            if term in synonyms:
-                expanded_terms.update(synonyms[term])
+        expanded_terms = expand_query_terms(tuple(query_lower.split()))
+
+        # Matches are (score, source, method id); result entries are only
+        # built for the ones that make the cut
+        matches = []
 
         def search_source(source_name, index_data, boost=0):
-            """Search a single source and return results."""
-            source_results = []
+            """Score a single source and return its matches, in index order."""
             if not index_data:
-                return source_results
-
-            for entity_name, entity in index_data.get("entities", {}).items():
-                for method in entity.get("methods", []):
-                    score = boost  # Mode-based boost
-                    text_to_search = "{} {} {}".format(
-                        method.get('name', ''),
-                        method.get('description', ''),
-                        method.get('summary', '')
-                    ).lower()
-
-                    for term in expanded_terms:
-                        if term in text_to_search:
-                            score += 1
-                        if term in method.get('name', '').lower():
-                            score += 2
-
-                    if score > boost:  # Only include if actual matches found
-                        source_results.append({
-                            "score": score,
-                            "source": source_name,
-                            "entity": entity_name,
-                            "name": method.get("name"),
-                            "type": "method",
-                            "signature": method.get("signature"),
-                            "description": method.get("summary", method.get("description", ""))[:150],
-                            "category": entity.get("category", "general"),
-                        })
-            return source_results
+                return []
+            method_index = api_index.method_indexes.get(source_name)
+            if method_index is None:
+                method_index = api_index.method_indexes[source_name] = MethodSearchIndex.build(index_data)
+            scores = method_index.score(expanded_terms)
+            return [(boost + scores[method_id], source_name, method_id) for method_id in sorted(scores)]
 
         # Search primary sources with boost
         for source in config["primary"]:
             if source == "flexlibs2" and api_index.flexlibs2:
-                results.extend(search_source("flexlibs2", api_index.flexlibs2, boost=5))
+                matches.extend(search_source("flexlibs2", api_index.flexlibs2, boost=5))
                 sources_searched.append("flexlibs2")
             elif source == "flexlibs_stable" and api_index.flexlibs_stable:
-                results.extend(search_source("flexlibs_stable", api_index.flexlibs_stable, boost=3))
+                matches.extend(search_source("flexlibs_stable", api_index.flexlibs_stable, boost=3))
                 sources_searched.append("flexlibs_stable")
             elif source == "liblcm" and api_index.liblcm:
-                results.extend(search_source("liblcm", api_index.liblcm, boost=0))
+                matches.extend(search_source("liblcm", api_index.liblcm, boost=0))
                 sources_searched.append("liblcm")
 
         # If not enough results, try fallback sources
-        if len(results) < max_results and config["fallback"]:
+        if len(matches) < max_results and config["fallback"]:
             for source in config["fallback"]:
                 if source == "liblcm" and api_index.liblcm and "liblcm" not in sources_searched:
-                    fallback_results = search_source("liblcm", api_index.liblcm, boost=0)
-                    results.extend(fallback_results)
-                    if fallback_results:
+                    fallback_matches = search_source("liblcm", api_index.liblcm, boost=0)
+                    matches.extend(fallback_matches)
+                    if fallback_matches:
                         sources_searched.append("liblcm (fallback)")
                         fallback_used = True
 
         # Sort by score and limit results
-        results.sort(key=lambda x: x["score"], reverse=True)
-        results = results[:max_results]
+        results = [
+            api_index.method_indexes[source_name].result(method_id, score, source_name)
+            for score, source_name, method_id in heapq.nlargest(max_results, matches, key=itemgetter(0))
+        ]
 
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=dumps_json({
         "query": query,
         "api_mode": api_mode,
         "api_mode_description": config["description"],
@@ -728,7 +1075,7 @@ async def handle_search_by_capability(args: dict) -> list[TextContent]:
         "semantic_available": api_index.semantic_search.enabled if api_index.semantic_search else False,
         "results_count": len(results),
         "results": results
-    }, indent=2))]
+    }))]
 
 
 def normalize_object_name(name: str) -> str:
@@ -813,7 +1160,7 @@ async def handle_get_navigation_path(args: dict) -> list[TextContent]:
     # Check if navigation graph is loaded
     if not api_index.navigation_graph:
         result["message"] = "Navigation graph not loaded. Run refresh.py to generate it."
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=dumps_json(result))]
 
     nav_graph = api_index.navigation_graph
     common_paths = nav_graph.get("common_paths", {})
@@ -828,7 +1175,7 @@ async def handle_get_navigation_path(args: dict) -> list[TextContent]:
         result["steps"] = path_info["steps"]
         result["code"] = path_info.get("code_pattern", "")
         result["description"] = f"Navigate from {from_normalized} to {to_normalized}"
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=dumps_json(result))]
 
     # Fall back to BFS pathfinding
     steps = find_path_bfs(graph, from_normalized, to_normalized)
@@ -838,7 +1185,7 @@ async def handle_get_navigation_path(args: dict) -> list[TextContent]:
         result["steps"] = steps
         result["code"] = generate_code_from_path(steps)
         result["description"] = f"Path found via BFS ({len(steps)} step{'s' if len(steps) != 1 else ''})"
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=dumps_json(result))]
 
     # No path found
     result["message"] = f"No navigation path found from {from_normalized} to {to_normalized}."
@@ -851,7 +1198,18 @@ async def handle_get_navigation_path(args: dict) -> list[TextContent]:
         if children:
             result["reachable_from_source"] = children
 
-    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    return [TextContent(type="text", text=dumps_json(result))]
+
+
+# Method-name substrings that mark each find_examples operation type
+_OPERATION_PATTERNS = {
+    "create": re.compile("create|add|new"),
+    "read": re.compile("get|find|fetch"),
+    "update": re.compile("set|update|modify"),
+    "delete": re.compile("delete|remove"),
+    "iterate": re.compile("getall|list|iterate"),
+    "search": re.compile("find|search|query"),
+}
 
 
 async def handle_find_examples(args: dict) -> list[TextContent]:
@@ -865,35 +1223,24 @@ async def handle_find_examples(args: dict) -> list[TextContent]:
 
     # Search FlexLibs 2.0 for examples (it has 82% example coverage)
     if api_index.flexlibs2:
-        for entity_name, entity in api_index.flexlibs2.get("entities", {}).items():
-            # Filter by object type if specified
-            if object_type and object_type.lower() not in entity_name.lower():
-                continue
-
-            for method in entity.get("methods", []):
+        method_name_lower = method_name.lower() if method_name else None
+        operation_re = _OPERATION_PATTERNS.get(operation_type)
+        lowered = api_index.lowered_entities["flexlibs2"]
+        if object_type:
+            # Filter by object type: only the entities whose name contains it
+            name_index = api_index.entity_name_index["flexlibs2"]
+            candidates = (lowered[i] for i in name_index.matches(object_type.lower()))
+        else:
+            candidates = lowered
+        for _, _, method_names_lower, entity_name, entity in candidates:
+            for method, name_lower in zip(entity.get("methods", []), method_names_lower):
                 # Filter by method name if specified
-                if method_name and method_name.lower() not in method.get("name", "").lower():
+                if method_name and method_name_lower not in name_lower:
                     continue
 
                 # Filter by operation type if specified
-                if operation_type:
-                    name_lower = method.get("name", "").lower()
-                    matches_op = False
-                    if operation_type == "create" and any(x in name_lower for x in ["create", "add", "new"]):
-                        matches_op = True
-                    elif operation_type == "read" and any(x in name_lower for x in ["get", "find", "fetch"]):
-                        matches_op = True
-                    elif operation_type == "update" and any(x in name_lower for x in ["set", "update", "modify"]):
-                        matches_op = True
-                    elif operation_type == "delete" and any(x in name_lower for x in ["delete", "remove"]):
-                        matches_op = True
-                    elif operation_type == "iterate" and any(x in name_lower for x in ["getall", "list", "iterate"]):
-                        matches_op = True
-                    elif operation_type == "search" and any(x in name_lower for x in ["find", "search", "query"]):
-                        matches_op = True
-
-                    if not matches_op:
-                        continue
+                if operation_type and not (operation_re and operation_re.search(name_lower)):
+                    continue
 
                 # Check if method has an example
                 if method.get("example"):
@@ -911,7 +1258,7 @@ async def handle_find_examples(args: dict) -> list[TextContent]:
             if len(examples) >= max_results:
                 break
 
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=dumps_json({
         "query": {
             "method_name": method_name,
             "operation_type": operation_type,
@@ -919,33 +1266,17 @@ async def handle_find_examples(args: dict) -> list[TextContent]:
         },
         "results_count": len(examples),
         "examples": examples
-    }, indent=2))]
+    }))]
 
 
 async def handle_list_categories(args: dict) -> list[TextContent]:
     """List all available API categories."""
-    categories = {}
-
-    # From FlexLibs 2.0
-    if api_index.flexlibs2:
-        fl2_cats = api_index.flexlibs2.get("categories", {})
-        for cat_name, cat_data in fl2_cats.items():
-            if cat_name not in categories:
-                categories[cat_name] = {"flexlibs2_count": 0, "liblcm_count": 0}
-            categories[cat_name]["flexlibs2_count"] = len(cat_data.get("entities", []))
+    categories = api_index.category_counts
 
-    # From LibLCM
-    if api_index.liblcm:
-        for entity in api_index.liblcm.get("entities", {}).values():
-            cat = entity.get("category", "uncategorized")
-            if cat not in categories:
-                categories[cat] = {"flexlibs2_count": 0, "liblcm_count": 0}
-            categories[cat]["liblcm_count"] += 1
-
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=dumps_json({
         "categories": categories,
         "total_categories": len(categories)
-    }, indent=2))]
+    }))]
 
 
 async def handle_list_entities_in_category(args: dict) -> list[TextContent]:
@@ -953,35 +1284,32 @@ async def handle_list_entities_in_category(args: dict) -> list[TextContent]:
     category = args["category"].lower()
 
     entities = {"flexlibs2": [], "liblcm": []}
+    by_source = api_index.entities_by_category.get(category, {})
 
     # From FlexLibs 2.0
-    if api_index.flexlibs2:
-        for entity_name, entity in api_index.flexlibs2.get("entities", {}).items():
-            if entity.get("category", "").lower() == category:
-                entities["flexlibs2"].append({
-                    "name": entity_name,
-                    "methods_count": len(entity.get("methods", [])),
-                    "summary": entity.get("summary", "")[:100]
-                })
+    for entity_name, entity in by_source.get("flexlibs2", []):
+        entities["flexlibs2"].append({
+            "name": entity_name,
+            "methods_count": len(entity.get("methods", [])),
+            "summary": entity.get("summary", "")[:100]
+        })
 
     # From LibLCM
-    if api_index.liblcm:
-        for entity_name, entity in api_index.liblcm.get("entities", {}).items():
-            if entity.get("category", "").lower() == category:
-                entities["liblcm"].append({
-                    "name": entity_name,
-                    "type": entity.get("type"),
-                    "summary": entity.get("summary", entity.get("description", ""))[:100]
-                })
+    for entity_name, entity in by_source.get("liblcm", []):
+        entities["liblcm"].append({
+            "name": entity_name,
+            "type": entity.get("type"),
+            "summary": entity.get("summary", entity.get("description", ""))[:100]
+        })
 
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=dumps_json({
         "category": category,
         "entities": entities,
         "counts": {
             "flexlibs2": len(entities["flexlibs2"]),
             "liblcm": len(entities["liblcm"])
         }
-    }, indent=2))]
+    }))]
 
 
 async def handle_get_module_template(args: dict) -> list[TextContent]:
@@ -1066,7 +1394,7 @@ if __name__ == '__main__':
         ]
     }
 
-    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    return [TextContent(type="text", text=dumps_json(result))]
 
 
 async def handle_start_module(args: dict) -> list[TextContent]:
@@ -1175,7 +1503,7 @@ async def handle_start_module(args: dict) -> list[TextContent]:
     # If we have required questions, return them along with optional ones
     if required_questions:
         questions = required_questions + optional_questions
-        return [TextContent(type="text", text=json.dumps({
+        return [TextContent(type="text", text=dumps_json({
             "status": "needs_input",
             "environment": env_info,
             "provided": provided,
@@ -1183,7 +1511,7 @@ async def handle_start_module(args: dict) -> list[TextContent]:
             "optional_questions": optional_questions,
             "questions": questions,  # Combined for convenience
             "instructions": "Please ask the user these questions and call start_module again with the answers. Optional questions can be skipped."
-        }, indent=2))]
+        }))]
 
     # All questions answered - generate the template
     module_name = args["module_name"]
@@ -1358,7 +1686,7 @@ if __name__ == '__main__':
 
     api_info = api_notes.get(api_target, {})
 
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=dumps_json({
         "status": "complete",
         "environment": env_info,
         "configuration": config,
@@ -1371,7 +1699,7 @@ if __name__ == '__main__':
         },
         "next_steps": next_steps,
         "testing_reminder": "Always test FlexTools modules on a backup or sample project first!" if not test_project else None
-    }, indent=2))]
+    }))]
 
 
 async def handle_run_module(args: dict) -> list[TextContent]:
@@ -1599,11 +1927,11 @@ MODULE_CODE = {module_code}
             f.write(full_script)
             temp_script_path = f.name
     except Exception as e:
-        return [TextContent(type="text", text=json.dumps({
+        return [TextContent(type="text", text=dumps_json({
             "success": False,
             "error": "Failed to create temporary script: {}".format(str(e)),
             "warnings": warnings
-        }, indent=2))]
+        }))]
 
     try:
         # Run the script in a subprocess
@@ -1647,21 +1975,21 @@ MODULE_CODE = {module_code}
         if stderr and not execution_result.get("error"):
             execution_result["stderr"] = stderr
 
-        return [TextContent(type="text", text=json.dumps(execution_result, indent=2, ensure_ascii=False))]
+        return [TextContent(type="text", text=dumps_json(execution_result))]
 
     except subprocess.TimeoutExpired:
-        return [TextContent(type="text", text=json.dumps({
+        return [TextContent(type="text", text=dumps_json({
             "success": False,
             "error": "Execution timed out after {} seconds".format(timeout_seconds),
             "warnings": warnings
-        }, indent=2))]
+        }))]
 
     except Exception as e:
-        return [TextContent(type="text", text=json.dumps({
+        return [TextContent(type="text", text=dumps_json({
             "success": False,
             "error": "Subprocess execution error: {}".format(str(e)),
             "warnings": warnings
-        }, indent=2))]
+        }))]
 
     finally:
         # Clean up temporary file
@@ -1937,11 +2265,11 @@ if __name__ == "__main__":
             f.write(runner_script)
             temp_script_path = f.name
     except Exception as e:
-        return [TextContent(type="text", text=json.dumps({
+        return [TextContent(type="text", text=dumps_json({
             "success": False,
             "error": "Failed to create temporary script: {}".format(str(e)),
             "warnings": warnings
-        }, indent=2))]
+        }))]
 
     try:
         # Create environment with UTF-8 encoding for Windows compatibility
@@ -1988,21 +2316,21 @@ if __name__ == "__main__":
         execution_result["warnings"] = warnings
         execution_result["exit_code"] = result.returncode
 
-        return [TextContent(type="text", text=json.dumps(execution_result, indent=2, default=str))]
+        return [TextContent(type="text", text=dumps_json(execution_result, default=str))]
 
     except subprocess.TimeoutExpired:
-        return [TextContent(type="text", text=json.dumps({
+        return [TextContent(type="text", text=dumps_json({
             "success": False,
             "error": "Execution timed out after {} seconds".format(timeout_seconds),
             "warnings": warnings
-        }, indent=2))]
+        }))]
 
     except Exception as e:
-        return [TextContent(type="text", text=json.dumps({
+        return [TextContent(type="text", text=dumps_json({
             "success": False,
             "error": "Subprocess execution error: {}".format(str(e)),
             "warnings": warnings
-        }, indent=2))]
+        }))]
 
     finally:
         # Clean up temporary file
@@ -2014,28 +2342,21 @@ if __name__ == "__main__":
 
 async def main():
     """Run the MCP server."""
-    global api_index
-
-    # Pre-load indexes
-    print("[INFO] Loading API indexes...", file=__import__("sys").stderr)
-    api_index = APIIndex.load(get_index_dir())
-
-    if api_index.liblcm:
-        print(f"[OK] LibLCM: {len(api_index.liblcm.get('entities', {}))} entities", file=__import__("sys").stderr)
-    else:
-        print("[WARN] LibLCM index not found", file=__import__("sys").stderr)
-
-    if api_index.flexlibs2:
-        print(f"[OK] FlexLibs 2.0: {len(api_index.flexlibs2.get('entities', {}))} entities", file=__import__("sys").stderr)
-    else:
-        print("[WARN] FlexLibs 2.0 index not found", file=__import__("sys").stderr)
+    # Load the indexes in the background while the server starts up; tool
+    # calls wait for the load to finish
+    print("[INFO] Loading API indexes...", file=sys.stderr)
+
+    def report_loaded(task: asyncio.Task):
+        if task.cancelled():
+            return
+        if task.exception():
+            print(f"[WARN] Failed to load API indexes: {task.exception()}", file=sys.stderr)
+        else:
+            log_index_summary(task.result())
 
-    if api_index.flexlibs_stable:
-        print(f"[OK] FlexLibs Stable: {len(api_index.flexlibs_stable.get('entities', {}))} entities", file=__import__("sys").stderr)
-    else:
-        print("[WARN] FlexLibs Stable index not found", file=__import__("sys").stderr)
+    asyncio.ensure_future(get_api_index()).add_done_callback(report_loaded)
 
-    print("[INFO] Starting MCP server...", file=__import__("sys").stderr)
+    print("[INFO] Starting MCP server...", file=sys.stderr)
 
     async with stdio_server() as (read_stream, write_stream):
         await server.run(read_stream, write_stream, server.create_initialization_options())